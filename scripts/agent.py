@@ -27,6 +27,7 @@ Output:
 
 import sys
 import os
+import copy
 import json
 import subprocess
 import shutil
@@ -82,7 +83,7 @@ from phases.tool_registry import (
     query_library,
     get_used_citation_keys,
     get_reviewed_papers,
-    export_literature_sheet,
+    iter_literature_sheet_rows,
 )
 from phases.orchestrator import (
     Orchestrator,
@@ -188,13 +189,33 @@ def log_debug(msg: str):
         _debug_logger.debug(msg)
 
 
+# Parsed checkpoints keyed by path -> (st_mtime_ns, st_size, data)
+_checkpoint_cache: Dict[Path, tuple] = {}
+
+
+def read_checkpoint(checkpoint_file: Path) -> Dict[str, Any]:
+    """
+    Parse checkpoint.json, reusing the last parse while the file is unchanged.
+    
+    Callers get their own copy: resume code mutates the returned dict, which
+    must not leak into the cached parse.
+    """
+    st = checkpoint_file.stat()
+    cached = _checkpoint_cache.get(checkpoint_file)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+    data = json.loads(checkpoint_file.read_text())
+    _checkpoint_cache[checkpoint_file] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
 def validate_checkpoint(checkpoint_file: Path) -> tuple[bool, Optional[str]]:
     """Validate checkpoint file and return (is_valid, error_message)."""
     if not checkpoint_file.exists():
         return False, "Checkpoint file not found"
     
     try:
-        checkpoint_data = json.loads(checkpoint_file.read_text())
+        checkpoint_data = read_checkpoint(checkpoint_file)
     except json.JSONDecodeError as e:
         return False, f"Corrupted checkpoint file: {e}"
     except Exception as e:
@@ -362,8 +383,8 @@ def generate_report(topic: str, max_revisions: int = 3, num_reviewers: int = 1,
         if not is_valid:
             raise RuntimeError(f"Cannot resume: {error_msg}")
         
-        # Load and restore state
-        checkpoint = json.loads(checkpoint_file.read_text())
+        # Load and restore state (already parsed by validate_checkpoint)
+        checkpoint = read_checkpoint(checkpoint_file)
         resumed_state = restore_state_from_checkpoint(checkpoint, report_dir)
         
         console.print(Panel(
@@ -409,7 +430,7 @@ def generate_report(topic: str, max_revisions: int = 3, num_reviewers: int = 1,
         """Load existing checkpoint if present."""
         if checkpoint_file.exists():
             try:
-                return json.loads(checkpoint_file.read_text())
+                return read_checkpoint(checkpoint_file)
             except Exception:
                 return None
         return None
@@ -951,8 +972,8 @@ def generate_report(topic: str, max_revisions: int = 3, num_reviewers: int = 1,
             _telegram_notifier.send_message(f"❌ Research complete but PDF generation failed. Check logs.")
     
     # Export literature sheet
-    literature_sheet = export_literature_sheet()
-    (report_dir / "literature_sheet.csv").write_text(literature_sheet)
+    with open(report_dir / "literature_sheet.csv", "w", newline="") as f:
+        f.writelines(iter_literature_sheet_rows())
     # Markdown sheet removed as requested
     log_debug(f"Literature sheet exported with {len(get_reviewed_papers())} papers")
     
@@ -1255,7 +1276,7 @@ Antigravity (Claude Opus 4.5 Thinking):
         
         if checkpoint_file.exists():
             try:
-                checkpoint = json.loads(checkpoint_file.read_text())
+                checkpoint = read_checkpoint(checkpoint_file)
                 # Try to get topic from checkpoint data or research plan
                 if "topic" in checkpoint.get("data", {}):
                     topic = checkpoint["data"]["topic"]
@@ -59,18 +59,22 @@ def preview_paper(index, temp_file_path):
     except Exception as e:
         print(f"Error reading preview: {e}")
 
+DOI_URL_RE = re.compile(r'doi\.org/(10\.\d+/[^\s]+)')
+DOI_RE = re.compile(r'(10\.\d+/[^\s]+)')
+ARXIV_URL_RE = re.compile(r'arxiv\.org/(?:abs|pdf)/(\d+\.\d+)')
+
 def extract_doi_from_url(url):
     """Extract DOI from various URL formats."""
     if not url:
         return None
     
     # Match doi.org URLs
-    doi_match = re.search(r'doi\.org/(10\.\d+/[^\s]+)', url)
+    doi_match = DOI_URL_RE.search(url)
     if doi_match:
         return doi_match.group(1)
     
     # Match DOIs embedded in other URLs
-    doi_match = re.search(r'(10\.\d+/[^\s]+)', url)
+    doi_match = DOI_RE.search(url)
     if doi_match:
         return doi_match.group(1)
     
@@ -82,7 +86,7 @@ def extract_arxiv_from_url(url):
         return None
     
     # Match arxiv.org URLs
-    arxiv_match = re.search(r'arxiv\.org/(?:abs|pdf)/(\d+\.\d+)', url)
+    arxiv_match = ARXIV_URL_RE.search(url)
     if arxiv_match:
         return arxiv_match.group(1)
     
@@ -28,6 +28,7 @@ from .tool_registry import (
     track_reviewed_paper,
     get_reviewed_papers,
     export_literature_sheet,
+    iter_literature_sheet_rows,
     literature_sheet,
 )
 
@@ -57,5 +58,6 @@ __all__ = [
     'track_reviewed_paper',
     'get_reviewed_papers',
     'export_literature_sheet',
+    'iter_literature_sheet_rows',
     'literature_sheet',
 ]
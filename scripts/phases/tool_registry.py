@@ -20,6 +20,7 @@ from tools import (
     track_reviewed_paper,
     get_reviewed_papers,
     export_literature_sheet,
+    iter_literature_sheet_rows,
     literature_sheet,
 )
 
@@ -190,5 +191,6 @@ __all__ = [
     "track_reviewed_paper",
     "get_reviewed_papers",
     "export_literature_sheet",
+    "iter_literature_sheet_rows",
     "literature_sheet",
 ]
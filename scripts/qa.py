@@ -13,6 +13,7 @@ import pickle
 import json
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 # Suppress LiteLLM verbose logging BEFORE any imports that use it
 os.environ['LITELLM_LOG'] = 'ERROR'
@@ -25,6 +26,18 @@ from rich.markdown import Markdown
 from dotenv import load_dotenv
 import logging
 
+# Fast JSON for manifest I/O (stdlib fallback)
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+    _json_loads = json.loads
+
 # Model routing (reasoning vs RAG)
 from utils.model_config import ModelRouting, ensure_model_env
 
@@ -37,7 +50,7 @@ try:
     import litellm
     litellm.suppress_debug_info = True
     litellm.set_verbose = False
-except:
+except ImportError:
     pass
 
 # Logging to file only (not console)
@@ -56,12 +69,95 @@ warnings.filterwarnings('ignore', category=DeprecationWarning, module='paperqa')
 warnings.filterwarnings('ignore', message='.*synchronous.*deprecated.*')
 warnings.filterwarnings('ignore', message='coroutine.*was never awaited')
 
+# Single-paper full-text fast path limits (skip retrieval for short questions)
+FULLTEXT_MAX_QUESTION_CHARS = 512
+FULLTEXT_MAX_CHARS = int(os.getenv('QA_FULLTEXT_MAX_CHARS', '200000'))
+
+# Papers ingested concurrently when indexing new PDFs
+INDEX_CONCURRENCY = int(os.getenv('QA_INDEX_CONCURRENCY', '4'))
+
+# Shared keep-alive HTTP clients for LiteLLM (embedding calls are small and
+# handshake-dominated, so reusing connections matters more than bandwidth)
+_HTTP_TIMEOUT_SECONDS = 600
+_HTTP_MAX_KEEPALIVE = 32
+_HTTP_MAX_CONNECTIONS = 64
+_aclient_loop = None
+
+# Unpickled Docs per pickle path: (pickle (st_mtime_ns, st_size), Docs).
+# Repeat queries in one process (e.g. query_library) reuse the object and
+# the vector index it builds lazily, instead of unpickling every time.
+_docs_cache = {}
+
+
+def configure_litellm_http_pool():
+    """Give LiteLLM persistent pooled httpx clients (HTTP/2 when h2 is installed)."""
+    global _aclient_loop
+    try:
+        import importlib.util
+        import httpx
+        import litellm
+    except ImportError:
+        return
+    
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(
+        max_keepalive_connections=_HTTP_MAX_KEEPALIVE,
+        max_connections=_HTTP_MAX_CONNECTIONS,
+    )
+    timeout = httpx.Timeout(_HTTP_TIMEOUT_SECONDS, connect=30.0)
+    
+    if getattr(litellm, "client_session", None) is None:
+        litellm.client_session = httpx.Client(http2=http2, limits=limits, timeout=timeout)
+    
+    # Async connections are bound to the event loop that opened them, so the
+    # AsyncClient is scoped to one loop: replaced when another loop calls in,
+    # and dropped when called outside any loop so litellm never reuses a
+    # client from a different loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is _aclient_loop and (loop is None or getattr(litellm, "aclient_session", None) is not None):
+        return
+    _close_async_client(getattr(litellm, "aclient_session", None), _aclient_loop)
+    if loop is None:
+        litellm.aclient_session = None
+    else:
+        litellm.aclient_session = httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+    _aclient_loop = loop
+
+
+def _close_async_client(client, loop):
+    """Close an AsyncClient on the loop that owns its connections, if it still runs."""
+    if client is None or loop is None or loop.is_closed():
+        # A closed loop has already torn down its transports
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            loop.run_until_complete(client.aclose())
+    except Exception as e:
+        logging.debug(f"Could not close previous LiteLLM AsyncClient: {e}")
+
+
 def setup_paperqa_settings(
     *,
     rag_model: "Optional[str]" = None,
     embedding_model: "Optional[str]" = None,
 ):
     """Configure paper-qa Settings for library RAG (model is configurable)."""
+    routing = ModelRouting.from_env(rag_model=rag_model, embedding_model=embedding_model)
+    
+    # Per event loop, so it stays outside the memoized part
+    configure_litellm_http_pool()
+    
+    return _build_paperqa_settings(routing.rag_model, routing.embedding_model)
+
+
+@lru_cache(maxsize=4)
+def _build_paperqa_settings(rag_model, embedding_model):
+    """Build Settings once per resolved model pair (also registers the usage callback once)."""
     from paperqa import Settings
     
     routing = ModelRouting.from_env(rag_model=rag_model, embedding_model=embedding_model)
@@ -147,6 +243,43 @@ def compute_md5(file_path):
     except Exception:
         return None
 
+def get_hash_cache_path(library_path):
+    return library_path / ".qa_hash_cache.json"
+
+def load_hash_cache(library_path):
+    """Relative PDF path -> [st_size, st_mtime_ns, md5] from previous runs."""
+    path = get_hash_cache_path(library_path)
+    try:
+        cache = _json_loads(path.read_bytes())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_hash_cache(library_path, cache):
+    try:
+        get_hash_cache_path(library_path).write_bytes(_json_dumps(cache))
+    except OSError:
+        pass
+
+def cached_md5(library_path, file_path, cache):
+    """
+    MD5 of a library PDF, reusing the cached digest while its size and
+    mtime are unchanged, so unchanged PDFs are stat'ed rather than re-read.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    key = os.path.relpath(file_path, library_path)
+    stamp = [st.st_size, st.st_mtime_ns]
+    hit = cache.get(key)
+    if hit and hit[:2] == stamp:
+        return hit[2]
+    file_hash = compute_md5(file_path)
+    if file_hash:
+        cache[key] = stamp + [file_hash]
+    return file_hash
+
 def get_blacklist_path(library_path):
     return library_path / ".qa_blacklist"
 
@@ -155,7 +288,7 @@ def load_blacklist(library_path):
     if path.exists():
         try:
             return set(path.read_text().splitlines())
-        except:
+        except (OSError, UnicodeDecodeError):
             pass
     return set()
 
@@ -166,7 +299,7 @@ def load_manifest(library_path):
     path = get_manifest_path(library_path)
     if path.exists():
         try:
-            d = json.loads(path.read_text())
+            d = _json_loads(path.read_bytes())
             return d
         except Exception as e:
             logging.error(f"Error loading manifest: {e}")
@@ -176,8 +309,8 @@ def load_manifest(library_path):
 def save_manifest(library_path, manifest):
     path = get_manifest_path(library_path)
     try:
-        path.write_text(json.dumps(manifest, indent=2))
-    except:
+        path.write_bytes(_json_dumps(manifest))
+    except (OSError, TypeError):
         pass
 
 def add_to_blacklist(library_path, filename):
@@ -185,7 +318,7 @@ def add_to_blacklist(library_path, filename):
     blacklist.add(filename)
     try:
         get_blacklist_path(library_path).write_text("\n".join(blacklist))
-    except:
+    except OSError:
         pass
 
 def get_pickle_path(library_path):
@@ -193,17 +326,32 @@ def get_pickle_path(library_path):
     return library_path / ".qa_docs.pkl"
 
 
+def _pickle_stamp(pkl_path):
+    """(st_mtime_ns, st_size) of the Docs pickle, or None when it is missing."""
+    try:
+        st = pkl_path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_existing_docs(library_path):
-    """Load existing Docs from pickle cache."""
+    """Load existing Docs from pickle cache (reused in-process while the pickle is unchanged)."""
     pkl_path = get_pickle_path(library_path)
-    if not pkl_path.exists():
+    stamp = _pickle_stamp(pkl_path)
+    if stamp is None:
         return None
+    
+    cached = _docs_cache.get(str(pkl_path))
+    if cached and cached[0] == stamp:
+        return cached[1]
         
     try:
         with open(pkl_path, 'rb') as f:
             docs = pickle.load(f)
         if docs and docs.docnames:
             logging.info(f"Loaded Docs with {len(docs.docnames)} documents from pickle")
+            _docs_cache[str(pkl_path)] = (stamp, docs)
             return docs
     except Exception as e:
         logging.warning(f"Failed to load existing pickle: {e}")
@@ -211,6 +359,68 @@ def load_existing_docs(library_path):
     return None
 
 
+def subset_docs(docs, dockeys):
+    """Build a Docs holding only the given dockeys' papers, reusing their embedded chunks."""
+    from paperqa import Docs
+    if not docs:
+        return None
+    
+    keep = {dockey: doc for dockey, doc in docs.docs.items() if dockey in dockeys}
+    if not keep:
+        return None
+    
+    texts = [t for t in docs.texts if t.doc.dockey in keep]
+    return Docs(docs=keep, texts=texts, docnames={d.docname for d in keep.values()})
+
+
+def dedupe_docnames(docs, dockeys):
+    """
+    Rename papers (among dockeys) that share a docname with an earlier paper.
+    
+    paperqa picks a unique docname before its awaited metadata/embedding
+    calls and registers it only afterwards, so concurrent aadd calls for two
+    same author-year papers can both claim it. Suffixes follow paperqa's own
+    scheme (Smith2020a, Smith2020b, ...).
+    """
+    taken = {doc.docname for doc in docs.docs.values()}
+    claimed = set()
+    renamed = {}
+    for dockey, doc in docs.docs.items():
+        name = doc.docname
+        if name not in claimed or dockey not in dockeys:
+            claimed.add(name)
+            continue
+        suffix = 0
+        new_name = name
+        while new_name in taken:
+            new_name = name + chr(ord("a") + suffix)
+            suffix += 1
+        taken.add(new_name)
+        claimed.add(new_name)
+        doc.docname = new_name
+        renamed[dockey] = (name, new_name)
+    if not renamed:
+        return docs
+    for text in docs.texts:
+        if text.doc.dockey in renamed:
+            old_name, new_name = renamed[text.doc.dockey]
+            text.name = text.name.replace(old_name, new_name, 1)
+            text.doc.docname = new_name
+    docs.docnames = {doc.docname for doc in docs.docs.values()}
+    logging.info(f"Renamed {len(renamed)} papers with clashing docnames")
+    return docs
+
+
+def use_quantized_index(docs):
+    """Swap the Docs text index for the int8-quantized store (embeddings are kept)."""
+    from utils.quantized_store import Int8VectorStore
+    if not isinstance(docs.texts_index, Int8VectorStore):
+        # Texts already carry their embeddings, so the new index is filled
+        # lazily at query time without any extra embedding calls
+        docs.texts_index = Int8VectorStore()
+    return docs
+
+
 def save_docs(library_path, docs):
     """Save Docs object to pickle cache."""
     pkl_path = get_pickle_path(library_path)
@@ -218,9 +428,43 @@ def save_docs(library_path, docs):
         with open(pkl_path, 'wb') as f:
             pickle.dump(docs, f)
         logging.info("Saved Docs to pickle")
+        # What was just written is what the next load would read back
+        _docs_cache[str(pkl_path)] = (_pickle_stamp(pkl_path), docs)
     except Exception as e:
         logging.error(f"Failed to save pickle: {e}")
 
+def mark_index_current(library_path):
+    """Re-stamp the Docs pickle as newer than library/ after a full walk found nothing to index."""
+    pkl_path = get_pickle_path(library_path)
+    before = _pickle_stamp(pkl_path)
+    try:
+        os.utime(pkl_path)
+    except OSError:
+        return
+    # Same bytes, new mtime: keep the in-process copy valid
+    cached = _docs_cache.get(str(pkl_path))
+    if cached and cached[0] == before:
+        _docs_cache[str(pkl_path)] = (_pickle_stamp(pkl_path), cached[1])
+
+def get_touch_path(library_path):
+    """Sentinel touched by utils.sync_bib whenever papers are added to the library."""
+    return library_path / ".last_touch"
+
+
+def library_unchanged_since_index(library_path):
+    """True when the Docs pickle is newer than library/ and its .last_touch sentinel."""
+    try:
+        pkl_mtime = get_pickle_path(library_path).stat().st_mtime
+        library_mtime = library_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    try:
+        touch_mtime = get_touch_path(library_path).stat().st_mtime
+    except FileNotFoundError:
+        touch_mtime = 0
+    return pkl_mtime >= max(library_mtime, touch_mtime)
+
+
 def get_fingerprint_path(library_path):
     """Get path to the fingerprint file."""
     return library_path / ".qa_fingerprint"
@@ -232,13 +476,43 @@ def load_fingerprint(library_path):
         try:
             with open(fp_path, 'r') as f:
                 return f.read().strip()
-        except:
+        except (OSError, UnicodeDecodeError):
             pass
     return None
 
 
 
 
+def iter_pdfs(root):
+    """Yield every PDF under root using os.scandir (no per-entry stat calls)."""
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".pdf"):
+                        yield Path(entry.path)
+        except OSError as e:
+            logging.warning(f"Cannot scan {directory}: {e}")
+
+
+def index_pdf_names(pdf_files):
+    """Pair each PDF with its lowercased folder and file names (computed once)."""
+    return [(p, p.parent.name.lower(), p.name.lower()) for p in pdf_files]
+
+
+def filter_pdfs(indexed_pdfs, filter_pattern):
+    """Return PDFs whose folder or file name contains the pattern (case-insensitive)."""
+    pattern_lower = filter_pattern.lower()
+    return [
+        p for p, folder, name in indexed_pdfs
+        if pattern_lower in folder or pattern_lower in name
+    ]
+
+
 def answer_question(question, library_path, filter_pattern=None):
     """Answer a question using papers in the library."""
     import asyncio
@@ -248,27 +522,29 @@ def answer_question(question, library_path, filter_pattern=None):
         console.print("\n[dim]Interrupted.[/dim]")
         sys.exit(0)
 
-async def _async_answer_question(question, library_path, filter_pattern=None):
-    from paperqa import Docs
+async def _async_load_library_docs(library_path, filter_pattern, settings):
+    """Load the cached Docs and index any new PDFs; shared by single, batch and chat queries."""
     from paperqa import Docs
     
-    # Setup settings
-    settings = setup_paperqa_settings()
+    # Unchanged library: skip the PDF walk and per-file hashing entirely
+    if not filter_pattern and library_unchanged_since_index(library_path):
+        docs = load_existing_docs(library_path)
+        if docs:
+            use_quantized_index(docs)
+            console.print(f"\n[dim]Library unchanged since last index ({len(docs.docs)} papers)[/dim]")
+            console.print("[green]✓ Library synchronized[/green]\n")
+            return docs
     
     # Find all PDFs in library
-    all_pdf_files = list(library_path.rglob("*.pdf"))
+    all_pdf_files = list(iter_pdfs(library_path))
     
     # Track if we should use manifest (default: yes if no filter or if filter fallback)
     use_manifest = True
     
     # Filter PDFs if pattern provided
     if filter_pattern:
-        pdf_files = []
-        pattern_lower = filter_pattern.lower()
-        for pdf in all_pdf_files:
-            # Check if pattern matches directory name or filename
-            if pattern_lower in pdf.parent.name.lower() or pattern_lower in pdf.name.lower():
-                pdf_files.append(pdf)
+        # Check if pattern matches directory name or filename
+        pdf_files = filter_pdfs(index_pdf_names(all_pdf_files), filter_pattern)
         
         if not pdf_files:
             # Graceful fallback: use all PDFs instead of erroring
@@ -291,61 +567,84 @@ async def _async_answer_question(question, library_path, filter_pattern=None):
     console.print(f"\n[dim]Found {len(pdf_files)} PDFs in library[/dim]")
     
     docs = None
-    try:
-        if use_manifest:
-            # Try to load existing docs from pickle
-            docs = load_existing_docs(library_path)
+    hash_cache = load_hash_cache(library_path)
+    hash_cache_before = dict(hash_cache)
+    
+    filter_hashes = {}  # Map path -> hash for a genuine filter
+    if use_manifest:
+        # Try to load existing docs from pickle
+        docs = load_existing_docs(library_path)
+    else:
+        # Genuine filter: carve the matching papers out of the cached
+        # full-library Docs so only uncached ones need indexing
+        filter_hashes = {pdf: cached_md5(library_path, pdf, hash_cache) for pdf in pdf_files}
+        docs = subset_docs(load_existing_docs(library_path), set(filter_hashes.values()))
+    
+    if not docs:
+        # Need to (re)index - create new Docs
+        docs = Docs()
+    use_quantized_index(docs)
         
-        if not docs:
-            # Need to (re)index - create new Docs
-            docs = Docs()
-            
-        if docs and hasattr(docs, 'docs'):
-            logging.info(f"Loaded {len(docs.docs) if docs and hasattr(docs, 'docs') else 0} docs from cache")
+    if docs and hasattr(docs, 'docs'):
+        logging.info(f"Loaded {len(docs.docs) if docs and hasattr(docs, 'docs') else 0} docs from cache")
 
-        # Identify new files to index by Content Hash via Manifest
-        files_to_index = []
-        files_hashes = {} # Map path -> hash
-        
-        if use_manifest:
-            # Load Blacklist & Manifest
-            blacklist = load_blacklist(library_path)
-            manifest = load_manifest(library_path)
+    # Identify new files to index by Content Hash via Manifest
+    files_to_index = []
+    files_hashes = {} # Map path -> hash
+    indexed_hashes = {} # Map filename -> hash for successfully indexed papers
+    
+    if use_manifest:
+        # Load Blacklist & Manifest
+        blacklist = load_blacklist(library_path)
+        manifest = load_manifest(library_path)
 
-            for pdf in pdf_files:
-                # Check blacklist first
-                if pdf.name in blacklist:
+        for pdf in pdf_files:
+            # Check blacklist first
+            if pdf.name in blacklist:
+                continue
+            
+            # Check Manifest
+            file_hash = cached_md5(library_path, pdf, hash_cache)
+            if file_hash:
+                # If file is in manifest AND hash matches, it's already indexed consistently
+                if pdf.name in manifest and manifest[pdf.name] == file_hash:
                     continue
                 
-                # Check Manifest
-                file_hash = compute_md5(pdf)
-                if file_hash:
-                    # If file is in manifest AND hash matches, it's already indexed consistently
-                    if pdf.name in manifest and manifest[pdf.name] == file_hash:
-                        continue
-                    
-                    # Otherwise index it
-                    files_to_index.append(pdf)
-                    files_hashes[pdf] = file_hash
-        else:
-            files_to_index = pdf_files
+                # Otherwise index it
+                files_to_index.append(pdf)
+                files_hashes[pdf] = file_hash
+    else:
+        for pdf, file_hash in filter_hashes.items():
+            if file_hash and file_hash in docs.docs:
+                continue  # Reused from the cached index
+            files_to_index.append(pdf)
+            if file_hash:
+                files_hashes[pdf] = file_hash
+    
+    if hash_cache != hash_cache_before:
+        save_hash_cache(library_path, hash_cache)
 
-        if not files_to_index and not filter_pattern:
-            console.print("[dim]Library fully indexed (no new content)[/dim]")
-        else:
-            logging.info(f"Need to index {len(files_to_index)} papers")
+    if not files_to_index and not filter_pattern:
+        console.print("[dim]Library fully indexed (no new content)[/dim]")
+    else:
+        logging.info(f"Need to index {len(files_to_index)} papers")
+    
+    if files_to_index:
+        console.print(f"[cyan]Indexing {len(files_to_index)} new papers...[/cyan]")
         
-        if files_to_index:
-            console.print(f"[cyan]Indexing {len(files_to_index)} new papers...[/cyan]")
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("[cyan]Adding papers to index...", total=len(files_to_index))
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("[cyan]Adding papers to index...", total=len(files_to_index))
-                
-                for i, pdf_path in enumerate(files_to_index, 1):
+            # Papers are ingested concurrently so one paper's PDF parsing
+            # (CPU, in-loop) overlaps other papers' embedding calls (network)
+            sem = asyncio.Semaphore(INDEX_CONCURRENCY)
+            
+            async def _index_one(i, pdf_path):
+                async with sem:
                     try:
                         logging.info(f"Adding paper {i}/{len(files_to_index)}: {pdf_path.name}")
                         progress.update(task, description=f"[cyan]Indexing {pdf_path.name}...")
@@ -357,18 +656,14 @@ async def _async_answer_question(question, library_path, filter_pattern=None):
                                 # Pass dockey to ensure persistence stability
                                 await docs.aadd(pdf_path, dockey=file_hash, settings=settings)
                             
-                            # Success: Update Manifest
+                            # Success: record for the manifest (written with the pickle)
                             if file_hash:
-                                manifest = load_manifest(library_path)
-                                manifest[pdf_path.name] = file_hash
-                                save_manifest(library_path, manifest)
+                                indexed_hashes[pdf_path.name] = file_hash
                                 
                             logging.info(f"Successfully added {pdf_path.name}")
                         except asyncio.TimeoutError:
                             logging.error(f"Timeout adding {pdf_path.name}")
                             console.print(f"[yellow]⚠ Timeout: {pdf_path.name}[/yellow]")
-                        
-                        progress.advance(task)
                     except Exception as e:
                         logging.error(f"Error adding {pdf_path}: {e}", exc_info=True)
                         console.print(f"[yellow]⚠ Failed: {pdf_path.name} - {e}[/yellow]")
@@ -376,50 +671,185 @@ async def _async_answer_question(question, library_path, filter_pattern=None):
                         if "not look like a text document" in str(e) or "Empty file" in str(e):
                              add_to_blacklist(library_path, pdf_path.name)
                              console.print(f"[red]  -> Added {pdf_path.name} to blacklist (will skip next time)[/red]")
-                        progress.advance(task)
-        
-        # CRITICAL: Explicitly build texts index to persist to Qdrant!
-        # paper-qa uses lazy indexing - vectors are only written during query
-        # We must force the index build here to ensure persistence
-        # REVERTED: Explicit build causes Qdrant client closure crash.
-        # PaperQA2 will build the index automatically during the first query/get_evidence call.
-        # This lazy indexing is robust and will persist normally.
-        if docs.texts and not filter_pattern:
-            logging.info(f"Have {len(docs.texts)} texts ready for query-time indexing")
-        # Save docs to pickle for persistence
-        if not filter_pattern and len(files_to_index) > 0:
-            save_docs(library_path, docs)
-            console.print("[green]✓ Saved database to disk[/green]")
-        console.print(f"[cyan]Docs ready ({len(docs.texts)} chunks). Indexing happens during query.[/cyan]")
-        
-        
-        console.print("[green]✓ Library synchronized[/green]\n")
+                    progress.advance(task)
+            
+            await asyncio.gather(*(_index_one(i, p) for i, p in enumerate(files_to_index, 1)))
         
-        # Query
-        with console.status("[bold cyan]Querying library with Gemini 2.5 Flash..."):
+        # Concurrent adds can hand two same author-year papers one docname
+        dedupe_docnames(docs, {h for h in files_hashes.values() if h})
+    
+    # CRITICAL: Explicitly build texts index to persist to Qdrant!
+    # paper-qa uses lazy indexing - vectors are only written during query
+    # We must force the index build here to ensure persistence
+    # REVERTED: Explicit build causes Qdrant client closure crash.
+    # PaperQA2 will build the index automatically during the first query/get_evidence call.
+    # This lazy indexing is robust and will persist normally.
+    if docs.texts and not filter_pattern:
+        logging.info(f"Have {len(docs.texts)} texts ready for query-time indexing")
+    # Save docs to pickle for persistence
+    if not filter_pattern and len(files_to_index) > 0:
+        save_docs(library_path, docs)
+        # Manifest only records papers that are actually in the saved pickle
+        if indexed_hashes:
+            manifest = load_manifest(library_path)
+            manifest.update(indexed_hashes)
+            save_manifest(library_path, manifest)
+        console.print("[green]✓ Saved database to disk[/green]")
+    elif not filter_pattern:
+        # Nothing new after a full walk: re-arm the unchanged-library fast
+        # path, which would otherwise stay off until the next paper is indexed
+        mark_index_current(library_path)
+    console.print(f"[cyan]Docs ready ({len(docs.texts)} chunks). Indexing happens during query.[/cyan]")
+    
+    
+    console.print("[green]✓ Library synchronized[/green]\n")
+    return docs
+
+
+async def _async_answer_question(question, library_path, filter_pattern=None):
+    # Setup settings
+    settings = setup_paperqa_settings()
+    docs = await _async_load_library_docs(library_path, filter_pattern, settings)
+    
+    # Fast path: one matched paper + short question -> one LLM call over its full text
+    if filter_pattern and len(docs.docs) == 1 and len(question) < FULLTEXT_MAX_QUESTION_CHARS:
+        with console.status("[bold cyan]Reading the paper..."):
+            response = await _async_answer_from_fulltext(question, docs, settings)
+        if response is not None:
+            logging.info(f"Full-text query successful: {question}")
+            return response
+    
+    # Query
+    with console.status("[bold cyan]Querying library with Gemini 2.5 Flash..."):
+        try:
+            response = await docs.aquery(question, settings=settings)
+            logging.info(f"Query successful: {question}")
+            return response
+        except Exception as e:
+            console.print(f"[bold red]Error querying:[/bold red] {e}")
+            logging.error(f"Query error: {e}")
+            sys.exit(1)
+
+
+async def _async_answer_from_fulltext(question, docs, settings):
+    """
+    Answer from a single paper's full text in one LLM call, skipping retrieval
+    and per-chunk evidence summaries. Returns None to fall back to docs.aquery.
+    """
+    from types import SimpleNamespace
+    import litellm
+    
+    doc = next(iter(docs.docs.values()))
+    paper_text = "\n\n".join(t.text for t in docs.texts if t.doc.dockey == doc.dockey)
+    if not paper_text or len(paper_text) > FULLTEXT_MAX_CHARS:
+        return None
+    
+    prompt = (
+        f"Answer the question using only the paper below. Cite it as ({doc.docname}). "
+        "If the paper does not contain the answer, say so.\n\n"
+        f"Paper: {doc.citation}\n\n{paper_text}\n\nQuestion: {question}"
+    )
+    try:
+        completion = await litellm.acompletion(
+            model=settings.llm,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        answer = completion.choices[0].message.content or ""
+    except Exception as e:
+        logging.warning(f"Full-text answer failed, falling back to retrieval: {e}")
+        return None
+    
+    # Minimal response-shaped object for format_answer/export_answer/query_library
+    return SimpleNamespace(
+        question=question,
+        answer=answer,
+        formatted_answer=f"{answer}\n\nReferences\n\n1. ({doc.docname}): {doc.citation}",
+        contexts=[SimpleNamespace(text=SimpleNamespace(name=doc.docname), score=None)],
+        context=paper_text,
+    )
+
+
+def answer_questions(questions, library_path, filter_pattern=None, export_dir=None, concurrency=8):
+    """Answer a batch of questions concurrently against one indexed library."""
+    try:
+        asyncio.run(_async_answer_questions(questions, library_path, filter_pattern, export_dir, concurrency))
+    except KeyboardInterrupt:
+        console.print("\n[dim]Interrupted.[/dim]")
+        sys.exit(0)
+
+async def _async_answer_questions(questions, library_path, filter_pattern=None, export_dir=None, concurrency=8):
+    settings = setup_paperqa_settings()
+    # Index once - the whole batch reuses the same Docs
+    docs = await _async_load_library_docs(library_path, filter_pattern, settings)
+    
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def _query(idx, question):
+        async with sem:
             try:
-                response = await docs.aquery(question, settings=settings)
-                logging.info(f"Query successful: {question}")
-                return response
+                return idx, await docs.aquery(question, settings=settings)
             except Exception as e:
-                console.print(f"[bold red]Error querying:[/bold red] {e}")
                 logging.error(f"Query error: {e}")
-                sys.exit(1)
+                return idx, e
+    
+    tasks = [asyncio.create_task(_query(i, q)) for i, q in enumerate(questions)]
+    
+    # Display in question order as answers resolve (small reorder buffer)
+    pending = {}
+    next_idx = 0
+    with console.status(f"[bold cyan]Querying library ({len(questions)} questions)..."):
+        for fut in asyncio.as_completed(tasks):
+            idx, result = await fut
+            pending[idx] = result
+            while next_idx in pending:
+                result = pending.pop(next_idx)
+                if isinstance(result, Exception):
+                    console.print(f"[bold red]Error querying:[/bold red] {questions[next_idx]} - {result}\n")
+                else:
+                    format_answer(result, export_dir, index=next_idx + 1)
+                next_idx += 1
+
+
+class _SlugTranslationTable(dict):
+    """str.translate table keeping alphanumerics and " -_"; filled lazily per codepoint."""
+
+    def __missing__(self, codepoint):
+        ch = chr(codepoint)
+        value = codepoint if ch.isalnum() or ch in " -_" else None
+        self[codepoint] = value
+        return value
 
-    except Exception:
-        raise
 
+_SLUG_TABLE = _SlugTranslationTable()
 
-def export_answer(response, export_dir):
-    """Export answer to markdown file."""
+
+def summarize_contexts(response, limit=5):
+    """Return [(source_name, score_or_None)] for the top contexts of a response."""
+    sources = []
+    for context in (getattr(response, 'contexts', None) or [])[:limit]:
+        name = getattr(getattr(context, 'text', None), 'name', "Unknown")
+        sources.append((name, getattr(context, 'score', None)))
+    return sources
+
+
+def export_answer(response, export_dir, sources=None, index=None):
+    """Export answer to markdown file; index numbers answers within a batch."""
+    if sources is None:
+        sources = summarize_contexts(response)
+    answer_text = response.formatted_answer or response.answer
+    
     export_path = Path(export_dir)
     export_path.mkdir(parents=True, exist_ok=True)
     
     # Generate filename from question and timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    question_slug = "".join(c if c.isalnum() or c in " -_" else "" for c in response.question[:50])
+    question_slug = response.question[:50].translate(_SLUG_TABLE)
     question_slug = question_slug.replace(" ", "_").lower()
-    filename = f"{timestamp}_{question_slug}.md"
+    # Batch answers are exported within the same second, so number them
+    if index is not None:
+        filename = f"{timestamp}_{index:03d}_{question_slug}.md"
+    else:
+        filename = f"{timestamp}_{question_slug}.md"
     filepath = export_path / filename
     
     # Create markdown content
@@ -431,27 +861,25 @@ def export_answer(response, export_dir):
 
 ## Answer
 
-{response.formatted_answer or response.answer}
+{answer_text}
 
 ## Sources
 
 """
     
-    if hasattr(response, 'contexts') and response.contexts:
-        for idx, context in enumerate(response.contexts[:5], 1):
-            source_name = context.text.name if hasattr(context.text, 'name') else "Unknown"
-            content += f"{idx}. {source_name}"
-            if hasattr(context, 'score'):
-                content += f" (Relevance: {context.score:.2f})"
-            content += "\n"
+    for idx, (source_name, score) in enumerate(sources, 1):
+        content += f"{idx}. {source_name}"
+        if score is not None:
+            content += f" (Relevance: {score:.2f})"
+        content += "\n"
     
     # Write to file
-    filepath.write_text(content)
+    filepath.write_bytes(content.encode("utf-8"))
     console.print(f"\n[green]✓ Exported to:[/green] {filepath}")
     return filepath
 
 
-def format_answer(response, export_dir=None):
+def format_answer(response, export_dir=None, index=None):
     """Format the answer with citations for display."""
     # Question
     console.print(Panel(
@@ -466,13 +894,13 @@ def format_answer(response, export_dir=None):
     console.print()
     
     # Context/Sources
-    if hasattr(response, 'contexts') and response.contexts:
+    sources = summarize_contexts(response)
+    if sources:
         console.print("[bold yellow]Sources:[/bold yellow]")
-        for idx, context in enumerate(response.contexts[:5], 1):
-            source_name = context.text.name if hasattr(context.text, 'name') else "Unknown"
+        for idx, (source_name, score) in enumerate(sources, 1):
             console.print(f"[cyan][{idx}][/cyan] {source_name}")
-            if hasattr(context, 'score'):
-                console.print(f"    [dim]Relevance: {context.score:.2f}[/dim]")
+            if score is not None:
+                console.print(f"    [dim]Relevance: {score:.2f}[/dim]")
         console.print()
     
     # Stats
@@ -481,7 +909,7 @@ def format_answer(response, export_dir=None):
     
     # Export if requested
     if export_dir:
-        export_answer(response, export_dir)
+        export_answer(response, export_dir, sources, index)
 
 
 def interactive_chat(library_path, filter_pattern=None, export_dir=None):
@@ -494,9 +922,6 @@ def interactive_chat(library_path, filter_pattern=None, export_dir=None):
         sys.exit(0)
 
 async def _async_interactive_chat(library_path, filter_pattern=None, export_dir=None):
-    from paperqa import Docs
-    from paperqa import Docs
-    
     console.print(Panel(
         "[bold cyan]Interactive Q&A Chat[/bold cyan]\n"
         "Ask questions about your library. Type 'exit' or 'quit' to stop.",
@@ -508,79 +933,9 @@ async def _async_interactive_chat(library_path, filter_pattern=None, export_dir=
     settings = setup_paperqa_settings()
     
     # Index library (same logic as answer_question)
-    all_pdf_files = list(library_path.rglob("*.pdf"))
+    docs = await _async_load_library_docs(library_path, filter_pattern, settings)
     
-    # Track if we should use manifest
-    use_manifest = True
-    
-    if filter_pattern:
-        pdf_files = [p for p in all_pdf_files 
-                     if filter_pattern.lower() in p.parent.name.lower() or 
-                        filter_pattern.lower() in p.name.lower()]
-        if pdf_files:
-            console.print(f"[cyan]Using {len(pdf_files)} PDFs matching '{filter_pattern}'[/cyan]")
-            use_manifest = False  # Genuine filter
-        else:
-            console.print(f"[dim]Filter '{filter_pattern}' matched no PDFs, using full library[/dim]")
-            pdf_files = all_pdf_files
-            use_manifest = True  # Fallback - use manifest
-    else:
-        pdf_files = all_pdf_files
-        console.print(f"[dim]Found {len(pdf_files)} PDFs[/dim]")
-    
-    docs = None
     try:
-        if use_manifest:
-            # Try to load existing docs from pickle
-            docs = load_existing_docs(library_path)
-        
-        if not docs:
-            # Need to (re)index - create new Docs
-            docs = Docs()
-            
-        # Collect existing hashes (dockeys)
-        indexed_hashes = set()
-        if docs and hasattr(docs, 'docs'):
-            for d in docs.docs.values():
-                if hasattr(d, 'dockey'):
-                    indexed_hashes.add(d.dockey)
-        
-        # Identify new files to index by Content Hash
-        files_to_index = []
-        files_hashes = {} # Map path -> hash
-        
-        if use_manifest:
-            for pdf in pdf_files:
-                file_hash = compute_md5(pdf)
-                if file_hash:
-                    if file_hash not in indexed_hashes:
-                        files_to_index.append(pdf)
-                        files_hashes[pdf] = file_hash
-        else:
-            files_to_index = pdf_files
-
-        if not files_to_index and use_manifest:
-            console.print("[dim]Library fully indexed (no new content)[/dim]")
-        
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-            task = progress.add_task("[cyan]Checking library for new papers...", total=len(files_to_index))
-            for pdf in files_to_index:
-                try:
-                    # docs.add is idempotent
-                    file_hash = files_hashes.get(pdf)
-                    await docs.aadd(pdf, dockey=file_hash, settings=settings)
-                except:
-                    pass
-                progress.advance(task)
-        
-        # Save docs to pickle for persistence
-        if use_manifest and len(files_to_index) > 0:
-            save_docs(library_path, docs)
-            console.print("[green]✓ Saved database to disk[/green]")
-        
-        
-        console.print("[green]✓ Library synchronized[/green]\n")
-        
         # Chat loop
         while True:
             try:
@@ -627,12 +982,14 @@ Examples:
   research qa --export qa_sessions "What are transformers?"
   research qa --chat
   research qa --chat --papers attention --export sessions/
+  research qa --file questions.txt --export sessions/
         """
     )
     parser.add_argument('question', nargs='*', help='Question to ask')
     parser.add_argument('--papers', '-p', help='Filter to papers matching this pattern (author, title, etc.)')
     parser.add_argument('--export', '-e', help='Export answers to this directory')
     parser.add_argument('--chat', '-c', action='store_true', help='Start interactive chat mode')
+    parser.add_argument('--file', '-f', help='Answer every question in this file (one per line) concurrently')
     
     args = parser.parse_args()
     
@@ -650,6 +1007,17 @@ Examples:
         console.print(f"\n[bold]Starting Interactive Chat[/bold]")
         console.print(f"[dim]RAG model: {routing.rag_model}[/dim]")
         interactive_chat(library_path, args.papers, args.export)
+    elif args.file:
+        # Batch mode
+        questions = [q.strip() for q in Path(args.file).read_text().splitlines() if q.strip()]
+        if not questions:
+            console.print(f"[bold red]No questions found in:[/bold red] {args.file}")
+            sys.exit(1)
+        
+        routing = ModelRouting.from_env()
+        console.print(f"\n[bold]Answering {len(questions)} questions[/bold]")
+        console.print(f"[dim]RAG model: {routing.rag_model}[/dim]")
+        answer_questions(questions, library_path, args.papers, args.export)
     else:
         # Single question mode
         if not args.question:
@@ -9,7 +9,7 @@ All tools are importable from this module:
     from tools import discover_papers, add_paper, fuzzy_cite, etc.
 """
 from .discovery import discover_papers, exa_search
-from .library import add_paper, batch_add_papers, list_library, query_library
+from .library import add_paper, add_papers_bulk, batch_add_papers, list_library, query_library
 from .citation import (
     fuzzy_cite,
     validate_citations,
@@ -17,8 +17,10 @@ from .citation import (
     get_used_citation_keys,
     clear_used_citation_keys,
     track_reviewed_paper,
+    track_reviewed_papers_bulk,
     get_reviewed_papers,
     export_literature_sheet,
+    iter_literature_sheet_rows,
     export_literature_sheet_markdown,
     literature_sheet
 )
@@ -29,6 +31,7 @@ __all__ = [
     'exa_search',
     # Library management
     'add_paper',
+    'add_papers_bulk',
     'batch_add_papers',
     'list_library', 
     'query_library',
@@ -40,8 +43,10 @@ __all__ = [
     'get_used_citation_keys',
     'clear_used_citation_keys',
     'track_reviewed_paper',
+    'track_reviewed_papers_bulk',
     'get_reviewed_papers',
     'export_literature_sheet',
+    'iter_literature_sheet_rows',
     'export_literature_sheet_markdown',
     'literature_sheet',
 ]
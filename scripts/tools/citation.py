@@ -5,17 +5,76 @@ Provides tools for managing and validating citations:
 - Fuzzy search for citation keys
 - Validation of citation keys against the library
 """
+import heapq
+import os
+import re
+import threading
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import yaml
 from rich.console import Console
 
+# Optional: orjson for the library index sidecar (stdlib json fallback)
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode("utf-8")
+    _json_loads = json.loads
+
 # Paths
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 LIBRARY_PATH = REPO_ROOT / "library"
 
 console = Console()
 
+# Parsed info.yaml entries keyed by path: (st_mtime_ns, entry).
+# Re-parsed only when a file's mtime changes; vanished files are dropped.
+_LIB_CACHE: Dict[str, Tuple[int, Optional[Dict[str, str]]]] = {}
+
+# Persisted copy of _LIB_CACHE; bump the version when the cached entry
+# fields change. Kept outside library/ so rewriting it never bumps the
+# library's mtime (which the QA index uses as its freshness check).
+INDEX_VERSION = 2
+INDEX_PATH = REPO_ROOT / ".cache" / "citation_index.json"
+
+# Parse cache misses in a thread pool once there are at least this many
+PARALLEL_PARSE_MIN = 32
+
+# Word tokens for the fuzzy_cite postings index
+_WORD_RE = re.compile(r"\w+")
+
+# Rows per chunk yielded by iter_literature_sheet_rows
+CSV_CHUNK_ROWS = 256
+
+# fuzzy_cite skips fuzzy scoring when at least this many papers contain
+# every query term verbatim
+SUBSTRING_HITS_MIN = 5
+
+# Bumped whenever _LIB_CACHE gains, changes or loses an entry, so derived
+# structures (e.g. the suggestion index) know when to rebuild.
+_lib_version = 0
+
+# Guards _LIB_CACHE, _lib_version and _library_snapshot: batch adds walk
+# the library from worker threads (reentrant, as the walk saves the index)
+_LIB_LOCK = threading.RLock()
+
+# (library version, entries) from the last walk, shared by fuzzy_cite lookups
+_library_snapshot: Tuple[int, List[Dict[str, str]]] = (-1, [])
+
+# (library version, lowercased keys, original keys, trigram -> key positions)
+_suggestion_index: Optional[Tuple[int, List[str], List[str], Dict[str, Set[int]]]] = None
+
 # Global state for tracking which papers were used during agent sessions
 _used_citation_keys: Set[str] = set()
 
@@ -28,7 +87,19 @@ _used_citation_keys: Set[str] = set()
 #   - titlehash:<hash>
 _reviewed_papers: Dict[str, Dict[str, Any]] = {}
 
+# citation_key -> paper_id for reviewed papers that have a library key
+_ck_to_pid: Dict[str, str] = {}
+
+# Bumped on every mutation of the structures above; update_cited_status
+# skips its full pass when nothing changed since it last ran.
+_mutation_counter = 0
+_cited_status_version: Optional[Tuple[int, int]] = None
+
+# Sheet order from _sorted_review_rows, keyed like _cited_status_version
+_sorted_rows_cache: Optional[Tuple[Tuple[int, int], List[Tuple[str, Dict[str, Any]]]]] = None
+
 
+@lru_cache(maxsize=4096)
 def _stable_title_hash(title: str) -> str:
     import hashlib
     t = (title or "").strip().lower().encode("utf-8")
@@ -53,6 +124,208 @@ def make_paper_id(
     return "unknown"
 
 
+def _parse_info_yaml(info_file: str) -> Optional[Dict[str, str]]:
+    """Extract the fields the citation tools need from one info.yaml."""
+    # libyaml's C parser when PyYAML was built with it; same safe semantics.
+    # Bytes go straight to the parser, skipping the Python-level decode.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(info_file, "rb") as f:
+        data = yaml.load(f, Loader=loader)
+    if not isinstance(data, dict):
+        return None
+
+    citation_key = data.get('ref', 'unknown')
+    title = data.get('title', 'Unknown')
+    authors = data.get('author', 'Unknown')
+    year = str(data.get('year', ''))
+    ref = str(data.get('ref', '') or '')
+    return {
+        "citation_key": citation_key,
+        "title": title,
+        "authors": authors,
+        "year": year,
+        "folder": os.path.basename(os.path.dirname(info_file)),
+        "ref": ref,
+        # Precomputed once per file change so lookups do no string work
+        "ref_lower": ref.lower(),
+        "searchable": f"{citation_key} {title} {authors} {year}".lower(),
+        # Lowercased identifiers for library membership checks
+        "doi": str(data.get('doi') or '').lower().strip(),
+        "eprint": str(data.get('eprint') or '').lower().strip(),
+    }
+
+
+def _safe_parse_info_yaml(info_file: str) -> Optional[Dict[str, str]]:
+    try:
+        return _parse_info_yaml(info_file)
+    except (yaml.YAMLError, OSError, UnicodeDecodeError):
+        # Unreadable or malformed entries are skipped, not fatal
+        return None
+
+
+def _load_index() -> None:
+    """
+    Seed the in-memory cache from the on-disk index so a fresh
+    process can skip parsing info.yaml files that have not changed.
+    """
+    if not INDEX_PATH.exists():
+        return
+    try:
+        with open(INDEX_PATH, "rb") as f:
+            index = _json_loads(f.read())
+        if index.get("version") != INDEX_VERSION:
+            return
+        for rel, (mtime_ns, entry) in index.get("entries", {}).items():
+            _LIB_CACHE.setdefault(os.path.join(LIBRARY_PATH, rel), (int(mtime_ns), entry))
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Corrupt or foreign index - the walk will rebuild it
+        pass
+
+
+def _save_index() -> None:
+    """Write the cache to INDEX_PATH atomically."""
+    import tempfile
+
+    with _LIB_LOCK:
+        tmp_name = None
+        try:
+            entries = {
+                os.path.relpath(info_file, LIBRARY_PATH).replace(os.sep, "/"): cached
+                for info_file, cached in _LIB_CACHE.items()
+            }
+            INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=INDEX_PATH.parent, prefix="citation_index.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps({"version": INDEX_VERSION, "entries": entries}))
+            os.replace(tmp_name, INDEX_PATH)
+        except (OSError, TypeError, ValueError, RuntimeError):
+            # Read-only library etc. - the in-memory cache still works
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+def _walk_info_yaml(root: str):
+    """
+    Yield (path, st_mtime_ns) for every info.yaml under root using an
+    os.scandir walk (no Path objects). Order and symlink handling match
+    Path.rglob: pre-order, subdirectories in scandir order, symlinked
+    dirs not followed.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name == "info.yaml":
+                        yield entry.path, entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+        # Pushed reversed so the first subdirectory is walked first
+        stack.extend(reversed(subdirs))
+
+
+def _iter_library() -> List[Dict[str, str]]:
+    """
+    Parsed library entries, re-parsing only info.yaml files whose mtime
+    changed since the last call (or since the on-disk index was written,
+    for a fresh process).
+    
+    Returns a list rather than yielding, so pruning and the index save
+    happen even when a caller stops iterating early.
+    """
+    global _lib_version
+    with _LIB_LOCK:
+        if not _LIB_CACHE:
+            _load_index()
+
+        walked = list(_walk_info_yaml(str(LIBRARY_PATH)))
+        seen = {info_file for info_file, _ in walked}
+        changed = False
+
+        # Parse new/modified files up front; a cold library is parsed in a
+        # thread pool since it is dominated by file reads.
+        misses = [
+            (info_file, mtime_ns)
+            for info_file, mtime_ns in walked
+            if _LIB_CACHE.get(info_file, (None,))[0] != mtime_ns
+        ]
+        if misses:
+            paths = [info_file for info_file, _ in misses]
+            if len(paths) >= PARALLEL_PARSE_MIN:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                    parsed = list(executor.map(_safe_parse_info_yaml, paths))
+            else:
+                parsed = [_safe_parse_info_yaml(path) for path in paths]
+            for (info_file, mtime_ns), entry in zip(misses, parsed):
+                _LIB_CACHE[info_file] = (mtime_ns, entry)
+            _lib_version += 1
+            changed = True
+
+        for stale in _LIB_CACHE.keys() - seen:
+            del _LIB_CACHE[stale]
+            _lib_version += 1
+            changed = True
+
+        if changed and seen:
+            _save_index()
+
+        return [
+            entry
+            for entry in (_LIB_CACHE[info_file][1] for info_file, _ in walked)
+            if entry is not None
+        ]
+
+
+def _get_suggestion_index(library_keys: Dict[str, str]):
+    """
+    Trigram index over library keys, rebuilt only when the library changes.
+    Positions follow library_keys order so "first match" stays stable.
+    """
+    global _suggestion_index
+    if _suggestion_index is None or _suggestion_index[0] != _lib_version:
+        lower_keys = list(library_keys.keys())
+        trigrams: Dict[str, Set[int]] = {}
+        for i, lk in enumerate(lower_keys):
+            for j in range(len(lk) - 2):
+                trigrams.setdefault(lk[j:j + 3], set()).add(i)
+        _suggestion_index = (_lib_version, lower_keys, list(library_keys.values()), trigrams)
+    return _suggestion_index[1:]
+
+
+def _suggest_key(key_lower: str, lower_keys: List[str], orig_keys: List[str], trigrams: Dict[str, Set[int]]) -> Optional[str]:
+    """
+    First library key (in library order) containing any '_'-separated part
+    of key_lower. Parts of 3+ chars are narrowed via the trigram postings
+    and then verified; shorter parts fall back to a scan.
+    """
+    best: Optional[int] = None
+    for part in key_lower.split('_'):
+        if len(part) < 3:
+            hits = (i for i, lk in enumerate(lower_keys) if part in lk)
+        else:
+            postings = sorted(
+                (trigrams.get(part[j:j + 3], set()) for j in range(len(part) - 2)),
+                key=len,
+            )
+            candidates = set(postings[0]).intersection(*postings[1:])
+            hits = (i for i in sorted(candidates) if part in lower_keys[i])
+        i = next(hits, None)
+        if i is not None and (best is None or i < best):
+            best = i
+    return orig_keys[best] if best is not None else None
+
+
 def get_used_citation_keys() -> Set[str]:
     """Get the set of citation keys that have been used."""
     return _used_citation_keys
@@ -60,9 +333,11 @@ def get_used_citation_keys() -> Set[str]:
 
 def clear_used_citation_keys():
     """Clear the tracked citation keys (call at start of new session)."""
-    global _used_citation_keys, _reviewed_papers
+    global _used_citation_keys, _reviewed_papers, _ck_to_pid, _mutation_counter
     _used_citation_keys = set()
     _reviewed_papers = {}
+    _ck_to_pid = {}
+    _mutation_counter += 1
 
 
 def track_reviewed_paper(
@@ -79,7 +354,8 @@ def track_reviewed_paper(
     used_as_evidence: bool = False,
 ):
     """Track a paper that was reviewed during the research process."""
-    global _reviewed_papers
+    global _reviewed_papers, _mutation_counter
+    _mutation_counter += 1
     paper_id = make_paper_id(citation_key=citation_key, doi=doi, arxiv_id=arxiv_id, title=title)
 
     existing = _reviewed_papers.get(paper_id, {})
@@ -101,6 +377,26 @@ def track_reviewed_paper(
         "used_as_evidence": bool(existing.get("used_as_evidence")) or bool(used_as_evidence),
         "source": source or existing.get("source", ""),
     }
+    ck = _reviewed_papers[paper_id]["citation_key"]
+    if ck:
+        _ck_to_pid[ck] = paper_id
+
+
+def track_reviewed_papers_bulk(rows: List[Dict[str, Any]]) -> int:
+    """
+    Track many reviewed papers in one call (e.g. a whole discovery result).
+    
+    Each row holds track_reviewed_paper keyword arguments. A malformed row
+    is skipped without affecting the rest. Returns the number tracked.
+    """
+    tracked = 0
+    for row in rows:
+        try:
+            track_reviewed_paper(**row)
+            tracked += 1
+        except (TypeError, ValueError):
+            pass
+    return tracked
 
 
 def mark_used_as_evidence(*, citation_key: Optional[str] = None, title: Optional[str] = None, source: str = "query_library") -> None:
@@ -108,7 +404,8 @@ def mark_used_as_evidence(*, citation_key: Optional[str] = None, title: Optional
     Mark a paper as having been used as evidence in a RAG answer.
     Best-effort matching by citation_key (preferred) or title.
     """
-    global _reviewed_papers
+    global _reviewed_papers, _mutation_counter
+    _mutation_counter += 1
 
     if citation_key:
         pid = make_paper_id(citation_key=citation_key)
@@ -141,11 +438,18 @@ def mark_used_as_evidence(*, citation_key: Optional[str] = None, title: Optional
 
 def update_cited_status():
     """Update the 'cited' flag for all reviewed papers based on used keys."""
-    global _reviewed_papers
-    for pid, data in _reviewed_papers.items():
-        ck = data.get("citation_key") or ""
-        if ck:
-            data["cited"] = ck in _used_citation_keys
+    global _reviewed_papers, _cited_status_version
+    # len() also catches keys added through get_used_citation_keys()
+    version = (len(_used_citation_keys), _mutation_counter)
+    if version == _cited_status_version:
+        return
+    _cited_status_version = version
+    # Used keys only grow within a session, so only rows whose key is in
+    # both sets can change - visit just the intersection.
+    for ck in _ck_to_pid.keys() & _used_citation_keys:
+        data = _reviewed_papers.get(_ck_to_pid[ck])
+        if data is not None:
+            data["cited"] = True
 
 
 def get_reviewed_papers() -> Dict[str, Dict[str, Any]]:
@@ -154,11 +458,61 @@ def get_reviewed_papers() -> Dict[str, Dict[str, Any]]:
     return _reviewed_papers
 
 
-def export_literature_sheet() -> str:
+def _sorted_review_rows() -> List[Tuple[str, Dict[str, Any]]]:
     """
-    Export a CSV literature review sheet with all papers reviewed.
-    
-    Format: citation_key,title,authors,year,relevance,utility,cited,source
+    Reviewed papers in sheet order: used (cited or evidence) first, then
+    cited, relevance, utility, year, paper_id. Shared by the CSV and
+    Markdown exporters; each row's key tuple is built once, up front, and
+    the order is reused until the reviewed/used state mutates again.
+    """
+    global _sorted_rows_cache
+    version = (len(_used_citation_keys), _mutation_counter)
+    if _sorted_rows_cache is not None and _sorted_rows_cache[0] == version:
+        return _sorted_rows_cache[1]
+
+    decorated = []
+    for pid, data in _reviewed_papers.items():
+        cited = bool(data.get("cited"))
+        used = cited or bool(data.get("used_as_evidence"))
+        decorated.append((
+            (
+                0 if used else 1,
+                0 if cited else 1,
+                -int(data.get("relevance", 0) or 0),
+                -int(data.get("utility", 0) or 0),
+                str(data.get("year") or ""),
+                pid,
+            ),
+            pid,
+            data,
+        ))
+    decorated.sort(key=itemgetter(0))
+    rows = [(pid, data) for _, pid, data in decorated]
+    _sorted_rows_cache = (version, rows)
+    return rows
+
+
+class _LineSink:
+    """Write-only target that collects csv.writer output until drained."""
+    __slots__ = ("lines",)
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def write(self, line: str) -> None:
+        self.lines.append(line)
+
+    def drain(self) -> str:
+        out = "".join(self.lines)
+        self.lines.clear()
+        return out
+
+
+def iter_literature_sheet_rows() -> Iterator[str]:
+    """
+    Yield the CSV literature review sheet in chunks of up to CSV_CHUNK_ROWS
+    formatted lines (header first), so callers can stream it to disk in
+    bounded memory.
     """
     update_cited_status()
     
@@ -168,13 +522,13 @@ def export_literature_sheet() -> str:
     # - relevance + used flags (so you can prioritize)
     # - source/citations (lightweight provenance)
     if not _reviewed_papers:
-        return "paper_id,citation_key,doi,arxiv_id,title,year,relevance,used,cited,used_as_evidence,source,citations\n"
+        yield "paper_id,citation_key,doi,arxiv_id,title,year,relevance,used,cited,used_as_evidence,source,citations\n"
+        return
     
     import csv
-    import io
     
-    output = io.StringIO()
-    writer = csv.writer(output)
+    sink = _LineSink()
+    writer = csv.writer(sink)
     
     # Header
     writer.writerow(
@@ -193,37 +547,48 @@ def export_literature_sheet() -> str:
             "citations",
         ]
     )
+    yield sink.drain()
     
-    # Sort by whether used (cited or evidence), then relevance/utility
-    sorted_papers = sorted(
-        _reviewed_papers.items(),
-        key=lambda x: (
-            0 if (x[1].get("cited") or x[1].get("used_as_evidence")) else 1,
-            0 if x[1].get("cited") else 1,
-            -int(x[1].get("relevance", 0) or 0),
-            -int(x[1].get("utility", 0) or 0),
-            str(x[1].get("year") or ""),
-            x[0],
-        ),
-    )
+    rows = ([
+        data.get("paper_id", ""),
+        data.get("citation_key", ""),
+        data.get("doi", ""),
+        data.get("arxiv_id", ""),
+        data.get("title", ""),
+        data.get("year", ""),
+        data.get("relevance", 0),
+        "true" if (data.get("cited") or data.get("used_as_evidence")) else "false",
+        "true" if data.get("cited") else "false",
+        "true" if data.get("used_as_evidence") else "false",
+        data.get("source", ""),
+        data.get("citations", ""),
+    ] for _, data in _sorted_review_rows())
     
-    for _, data in sorted_papers:
-        writer.writerow([
-            data.get("paper_id", ""),
-            data.get("citation_key", ""),
-            data.get("doi", ""),
-            data.get("arxiv_id", ""),
-            data.get("title", ""),
-            data.get("year", ""),
-            data.get("relevance", 0),
-            "true" if (data.get("cited") or data.get("used_as_evidence")) else "false",
-            "true" if data.get("cited") else "false",
-            "true" if data.get("used_as_evidence") else "false",
-            data.get("source", ""),
-            data.get("citations", ""),
-        ])
-        
-    return output.getvalue()
+    # writerows hands each chunk to the C writer loop in one call
+    while True:
+        writer.writerows(islice(rows, CSV_CHUNK_ROWS))
+        chunk = sink.drain()
+        if not chunk:
+            break
+        yield chunk
+
+
+def export_literature_sheet() -> str:
+    """
+    Export a CSV literature review sheet with all papers reviewed.
+    
+    Format: citation_key,title,authors,year,relevance,utility,cited,source
+    Prefer iter_literature_sheet_rows() when writing straight to a file.
+    """
+    return "".join(iter_literature_sheet_rows())
+
+
+_MD_ROW = "| {} | {} | {} | {} | {} | {} | {} | {} | {} |".format
+
+
+def _md_escape(v: Any) -> str:
+    s = str(v or "")
+    return s.replace("|", "\\|").replace("\n", " ").strip()
 
 
 def export_literature_sheet_markdown(limit: int = 200) -> str:
@@ -240,30 +605,21 @@ def export_literature_sheet_markdown(limit: int = 200) -> str:
     if not _reviewed_papers:
         return header
 
-    sorted_papers = sorted(
-        _reviewed_papers.items(),
-        key=lambda x: (
-            0 if (x[1].get("cited") or x[1].get("used_as_evidence")) else 1,
-            0 if x[1].get("cited") else 1,
-            -int(x[1].get("relevance", 0) or 0),
-            x[0],
-        ),
-    )
-
-    lines = [header]
-    for key, data in sorted_papers[: max(1, int(limit))]:
-        def esc(v: Any) -> str:
-            s = str(v or "")
-            return s.replace("|", "\\|").replace("\n", " ").strip()
-
-        lines.append(
-            f"| {esc(data.get('paper_id', key))} | {esc(data.get('citation_key'))} | {esc(data.get('title'))} | "
-            f"{esc(data.get('year'))} | {data.get('relevance', 0)} | "
-            f"{'yes' if (data.get('cited') or data.get('used_as_evidence')) else 'no'} | "
-            f"{'yes' if data.get('cited') else 'no'} | {'yes' if data.get('used_as_evidence') else 'no'} | {esc(data.get('source'))} |\\n"
+    rows = (
+        _MD_ROW(
+            _md_escape(data.get('paper_id', key)),
+            _md_escape(data.get('citation_key')),
+            _md_escape(data.get('title')),
+            _md_escape(data.get('year')),
+            data.get('relevance', 0),
+            'yes' if (data.get('cited') or data.get('used_as_evidence')) else 'no',
+            'yes' if data.get('cited') else 'no',
+            'yes' if data.get('used_as_evidence') else 'no',
+            _md_escape(data.get('source')),
         )
-
-    return "".join(lines)
+        for key, data in _sorted_review_rows()[: max(1, int(limit))]
+    )
+    return header + "\n".join(rows) + "\n"
 
 
 def literature_sheet(limit: int = 20, only_uncited: bool = False, verbose: bool = False) -> Dict[str, Any]:
@@ -277,16 +633,18 @@ def literature_sheet(limit: int = 20, only_uncited: bool = False, verbose: bool
     """
     update_cited_status()
 
-    items = sorted(
-        _reviewed_papers.items(),
-        key=lambda x: (-x[1].get("relevance", 0), -x[1].get("utility", 0), x[0]),
-    )
+    items = _reviewed_papers.items()
     if only_uncited:
         items = [(k, v) for (k, v) in items if not v.get("cited")]
 
     limit_n = max(1, int(limit))
+    items = heapq.nsmallest(
+        limit_n,
+        items,
+        key=lambda x: (-x[1].get("relevance", 0), -x[1].get("utility", 0), x[0]),
+    )
     rows: List[Dict[str, Any]] = []
-    for key, data in items[:limit_n]:
+    for key, data in items:
         used = bool(data.get("cited")) or bool(data.get("used_as_evidence"))
         row: Dict[str, Any] = {
             "paper_id": data.get("paper_id", key),
@@ -354,6 +712,145 @@ def literature_sheet(limit: int = 20, only_uncited: bool = False, verbose: bool
     }
 
 
+@lru_cache(maxsize=1)
+def _has_rapidfuzz() -> bool:
+    try:
+        import rapidfuzz  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=256)
+def _any_term_pattern(parts: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    One compiled alternation testing whether any literal query term occurs,
+    in a single C-level search.
+    """
+    return re.compile("|".join(re.escape(p) for p in parts))
+
+
+def _current_library() -> Tuple[int, List[Dict[str, str]]]:
+    """Walk the library and return (version, entries), reusing the entry
+    list while the version is unchanged."""
+    global _library_snapshot
+    with _LIB_LOCK:
+        entries = _iter_library()
+        if _library_snapshot[0] != _lib_version:
+            _library_snapshot = (_lib_version, entries)
+        return _library_snapshot
+
+
+@lru_cache(maxsize=2)
+def _token_postings(version: int) -> Dict[str, Set[int]]:
+    """Word token -> positions in the current library snapshot."""
+    postings: Dict[str, Set[int]] = {}
+    for i, entry in enumerate(_library_snapshot[1]):
+        for token in set(_WORD_RE.findall(entry["searchable"])):
+            postings.setdefault(token, set()).add(i)
+    return postings
+
+
+@lru_cache(maxsize=256)
+def _match_library(query_lower: str, version: int) -> Tuple[Tuple[Tuple[str, Any], ...], ...]:
+    """
+    Top-10 library matches for a lowercased query, as tuples of (field, value)
+    pairs. Cached per library version, so a changed library misses the cache
+    without explicit eviction.
+    """
+    candidates = _library_snapshot[1]
+    query_parts = query_lower.split()
+    results = []
+    
+    # Cheap exact pass first: when enough papers contain every query term
+    # verbatim, they are the best matches anyway (partial_ratio 100 on each
+    # part), so skip fuzzy scoring and prefer the tightest records.
+    # A whole-word term can only occur inside a single word token, so for
+    # whole-word queries the scan runs over the distinct tokens of the
+    # postings index instead of every record: each term matches the papers
+    # of every token containing it, prefixes and fragments included.
+    substring_hits = []
+    if query_parts and _has_rapidfuzz():
+        if all(_WORD_RE.fullmatch(part) for part in query_parts):
+            postings = _token_postings(version)
+            hit_ids: Set[int] = set()
+            for n, part in enumerate(query_parts):
+                part_ids = set().union(
+                    *(ids for token, ids in postings.items() if part in token)
+                )
+                hit_ids = part_ids if n == 0 else hit_ids & part_ids
+                if not hit_ids:
+                    break
+            substring_hits = [candidates[i] for i in sorted(hit_ids)]
+        else:
+            substring_hits = [
+                c for c in candidates
+                if all(part in c["searchable"] for part in query_parts)
+            ]
+    
+    if len(substring_hits) >= SUBSTRING_HITS_MIN:
+        for c in heapq.nsmallest(10, substring_hits, key=lambda c: len(c["searchable"])):
+            results.append({
+                "citation_key": c["citation_key"],
+                "title": c["title"][:70],
+                "authors": c["authors"][:40],
+                "year": c["year"],
+                "score": 100.0,
+            })
+    elif _has_rapidfuzz():
+        from rapidfuzz import fuzz, process
+
+        # True fuzzy matching with rapidfuzz
+        # Score each candidate against the full query and each query part
+        # (OR logic: best match wins). partial_ratio keeps matching
+        # substring-friendly; process.extract scans all choices in C and
+        # drops anything under the "good enough" threshold of 60.
+        # A single-term query is its own only part, so it is scored once.
+        multi_term = len(query_parts) > 1
+        choices = [c["searchable"] for c in candidates]
+        best_scores: Dict[int, float] = {}
+        for q in ([query_lower, *query_parts] if multi_term else [query_lower]):
+            for _, score, idx in process.extract(
+                q, choices, scorer=fuzz.partial_ratio, score_cutoff=60, limit=None
+            ):
+                if score > best_scores.get(idx, 0):
+                    best_scores[idx] = score
+        scored = [(candidates[idx], score) for idx, score in sorted(best_scores.items())]
+        
+        # Multi-term queries: among equal scores, prefer papers matching
+        # more of the terms (token_set_ratio on the shortlist only)
+        if multi_term and scored:
+            tie_breaks = [fuzz.token_set_ratio(query_lower, c["searchable"]) for c, _ in scored]
+        else:
+            tie_breaks = [0] * len(scored)
+        
+        # Top 10 by score, descending
+        ranked = heapq.nlargest(10, zip(scored, tie_breaks), key=lambda x: (x[0][1], x[1]))
+        for (c, score), _ in ranked:
+            results.append({
+                "citation_key": c["citation_key"],
+                "title": c["title"][:70],
+                "authors": c["authors"][:40],
+                "year": c["year"],
+                "score": score,
+            })
+    else:
+        # Fallback: substring matching with OR logic (any part matches)
+        has_any_term = _any_term_pattern(tuple(query_parts)).search if query_parts else None
+        for c in candidates:
+            # OR logic: match if ANY query part is found
+            if has_any_term and has_any_term(c["searchable"]):
+                results.append({
+                    "citation_key": c["citation_key"],
+                    "title": c["title"][:70],
+                    "authors": c["authors"][:40],
+                    "year": c["year"],
+                })
+        results = results[:10]
+    
+    return tuple(tuple(r.items()) for r in results)
+
+
 def fuzzy_cite(query: str) -> List[Dict[str, str]]:
     """
     Fuzzy search for citation keys in the library.
@@ -370,46 +867,20 @@ def fuzzy_cite(query: str) -> List[Dict[str, str]]:
         List of matching papers with: citation_key, title, authors, year, score
         Track these keys - they will be included in refs.bib
     """
-    global _used_citation_keys
-    import yaml
+    global _used_citation_keys, _mutation_counter
     
-    # Try to import rapidfuzz for true fuzzy matching
-    try:
-        from rapidfuzz import fuzz, process
-        use_fuzzy = True
-    except ImportError:
-        use_fuzzy = False
+    if not _has_rapidfuzz():
         console.print("[dim]⚠ rapidfuzz not installed, using substring matching[/dim]")
     
     console.print(f"[dim]📚 Fuzzy cite search: {query}[/dim]")
     
+    # Build candidate list from library (cached per info.yaml mtime) and
+    # match under the library lock, so the snapshot _match_library reads
+    # is the one for this version
     query_lower = query.lower().strip()
-    query_parts = query_lower.split()
-    
-    # Build candidate list from library
-    candidates = []
-    for info_file in LIBRARY_PATH.rglob("info.yaml"):
-        try:
-            with open(info_file) as f:
-                data = yaml.safe_load(f)
-            
-            citation_key = data.get('ref', 'unknown')
-            title = data.get('title', 'Unknown')
-            authors = data.get('author', 'Unknown')
-            year = str(data.get('year', ''))
-            
-            # Build searchable text
-            searchable = f"{citation_key} {title} {authors} {year}".lower()
-            
-            candidates.append({
-                "citation_key": citation_key,
-                "title": title,
-                "authors": authors,
-                "year": year,
-                "searchable": searchable,
-            })
-        except:
-            pass
+    with _LIB_LOCK:
+        version, candidates = _current_library()
+        matched = _match_library(query_lower, version) if candidates else ()
     
     if not candidates:
         console.print(f"[yellow]⚠ Library empty - use discover_papers first[/yellow]")
@@ -421,53 +892,16 @@ def fuzzy_cite(query: str) -> List[Dict[str, str]]:
             "suggestion": f"discover_papers(\"{query}\")"
         }]
     
-    results = []
-    
-    if use_fuzzy:
-        # True fuzzy matching with rapidfuzz
-        # Score each candidate against query parts (OR logic: best match wins)
-        scored = []
-        for c in candidates:
-            # For each query part, compute fuzzy score against searchable text
-            # Use partial_ratio for substring-friendly matching
-            part_scores = [fuzz.partial_ratio(part, c["searchable"]) for part in query_parts]
-            # Also try the full query
-            full_score = fuzz.partial_ratio(query_lower, c["searchable"])
-            # Best score: max of individual parts or full query
-            best_score = max(max(part_scores) if part_scores else 0, full_score)
-            
-            if best_score >= 60:  # Threshold for "good enough" match
-                scored.append((c, best_score))
-        
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
-        
-        for c, score in scored[:10]:
-            results.append({
-                "citation_key": c["citation_key"],
-                "title": c["title"][:70],
-                "authors": c["authors"][:40],
-                "year": c["year"],
-                "score": score,
-            })
-    else:
-        # Fallback: substring matching with OR logic (any part matches)
-        for c in candidates:
-            # OR logic: match if ANY query part is found
-            if any(part in c["searchable"] for part in query_parts):
-                results.append({
-                    "citation_key": c["citation_key"],
-                    "title": c["title"][:70],
-                    "authors": c["authors"][:40],
-                    "year": c["year"],
-                })
-        results = results[:10]
+    # Matching is pure given (query, library version); side effects below
+    # run on every call so tracking stays correct on cache hits.
+    results = [dict(r) for r in matched]
     
     # Track matched keys
     for r in results:
         key = r["citation_key"]
         if key:
             _used_citation_keys.add(key)
+            _mutation_counter += 1
             try:
                 track_reviewed_paper(
                     citation_key=key,
@@ -513,22 +947,12 @@ def citation_key_to_pdf_filter(citation_key: str) -> str:
         A filter pattern that will match the PDF (folder name or filename fragment),
         or empty string if not found
     """
-    import yaml
-    
     key_lower = citation_key.lower().strip()
     
-    for info_file in LIBRARY_PATH.rglob("info.yaml"):
-        try:
-            with open(info_file) as f:
-                data = yaml.safe_load(f)
-            
-            ref = data.get('ref', '').lower()
-            if ref == key_lower:
-                # Found it - return the folder name as the filter
-                folder_name = info_file.parent.name
-                return folder_name
-        except:
-            pass
+    for entry in _iter_library():
+        if entry["ref_lower"] == key_lower:
+            # Found it - return the folder name as the filter
+            return entry["folder"]
     
     # Fallback: return empty string (will query full library)
     return ""
@@ -549,7 +973,6 @@ def validate_citations(citation_keys: List[str]) -> Dict[str, Any]:
     Returns:
         Dict with 'valid' keys, 'invalid' keys, and 'suggestions' for invalid ones
     """
-    import yaml
     import json
     import ast
     
@@ -580,19 +1003,14 @@ def validate_citations(citation_keys: List[str]) -> Dict[str, Any]:
     
     # Build library of all valid keys
     library_keys = {}
-    for info_file in LIBRARY_PATH.rglob("info.yaml"):
-        try:
-            with open(info_file) as f:
-                data = yaml.safe_load(f)
-            key = data.get('ref', '')
-            if key:
-                library_keys[key.lower()] = key
-        except:
-            pass
+    for entry in _iter_library():
+        if entry["ref"]:
+            library_keys[entry["ref_lower"]] = entry["ref"]
     
     valid = []
     invalid = []
     suggestions = {}
+    suggestion_index = None
     
     for key in citation_keys:
         key_lower = key.lower()
@@ -601,10 +1019,11 @@ def validate_citations(citation_keys: List[str]) -> Dict[str, Any]:
         else:
             invalid.append(key)
             # Find similar keys
-            for lib_key in library_keys.values():
-                if any(part in lib_key.lower() for part in key_lower.split('_')):
-                    suggestions[key] = lib_key
-                    break
+            if suggestion_index is None:
+                suggestion_index = _get_suggestion_index(library_keys)
+            suggestion = _suggest_key(key_lower, *suggestion_index)
+            if suggestion:
+                suggestions[key] = suggestion
     
     if invalid:
         console.print(f"[yellow]⚠ {len(invalid)} invalid keys: {invalid[:5]}[/yellow]")
@@ -6,23 +6,35 @@ Provides unified paper discovery across multiple sources:
 - Paper-scraper (PubMed, bioRxiv, Springer, arXiv)
 - Exa.ai (neural/semantic search, costs credits)
 """
+import concurrent.futures
 import os
 import re
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 # Session literature tracking
-from .citation import track_reviewed_paper
+from .citation import track_reviewed_papers_bulk
 
 # Paths
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 SCRIPTS_PATH = REPO_ROOT / "scripts"
 
+# utils/ sits beside tools/ under scripts/; make it importable once
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
+# Optional: paper-scraper client (keyword search falls back to S2 only)
+try:
+    from utils import scraper_client
+except ImportError:
+    scraper_client = None
+
 console = Console()
 
 # Graceful external tool import
@@ -32,6 +44,265 @@ except ImportError:
     discover_via_private = None
     PRIVATE_SOURCES_AVAILABLE = False
 
+# Identifier extraction from Exa result URLs
+_ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5})')
+_DOI_RE = re.compile(r'(10\.\d{4,}/[^\s]+)')
+
+_DOI_PREFIXES = ('https://doi.org/', 'http://doi.org/', 'https://dx.doi.org/', 'http://dx.doi.org/', 'doi:')
+
+# Only the fields discover_papers reads, for search and citation-network calls
+S2_SEARCH_FIELDS = ['title', 'authors', 'year', 'abstract', 'externalIds', 'citationCount']
+
+# Largest page the S2 Graph API serves for citations/references
+S2_MAX_PAGE = 1000
+
+# Abstract length kept on discovery results
+ABSTRACT_CHARS = 400
+
+# Per-source timeouts for keyword search (seconds, measured from submission)
+S2_TIMEOUT = 30
+PS_TIMEOUT = 5
+
+# After a source hangs or is unreachable (or, for paper-scraper, fails) it
+# is skipped for this long instead of burning its timeout on every call
+# (seconds)
+SOURCE_COOLDOWN = 600
+_source_down_until: Dict[str, float] = {}
+
+# Transport failures that take Exa out for SOURCE_COOLDOWN; API errors
+# (bad key, quota, bad request) are reported but don't trip it
+try:
+    import requests
+    _EXA_NETWORK_ERRORS = (TimeoutError, ConnectionError, requests.ConnectionError, requests.Timeout)
+except ImportError:
+    _EXA_NETWORK_ERRORS = (TimeoutError, ConnectionError)
+
+# Recent keyword searches: (query, limit) -> (monotonic time, papers).
+# Agents often re-issue the same query within a session; reuse the merged
+# network results for a few minutes instead of hitting S2/PS again.
+DISCOVERY_CACHE_TTL = 300
+DISCOVERY_CACHE_SIZE = 128
+_search_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Shared pool so S2 and paper-scraper run side by side without per-call
+# thread setup. Hung calls are abandoned, not joined, by discover_papers.
+_DISCOVERY_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="discovery")
+
+_s2_client = None
+_s2_client_lock = threading.Lock()
+
+
+def _get_s2_client():
+    """Shared Semantic Scholar client (API key if available for higher rate limits)."""
+    global _s2_client
+    with _s2_client_lock:
+        if _s2_client is None:
+            from semanticscholar import SemanticScholar
+            s2_api_key = os.getenv('SEMANTIC_SCHOLAR_API_KEY')
+            # Enforce the S2 budget in the HTTP layer too, so a stalled
+            # request ends and frees its worker instead of hanging it
+            kwargs = {'timeout': S2_TIMEOUT}
+            if s2_api_key:
+                kwargs['api_key'] = s2_api_key
+            _s2_client = SemanticScholar(**kwargs)
+        return _s2_client
+
+
+_exa_client = None
+_exa_client_key = None
+_exa_client_lock = threading.Lock()
+
+
+def _get_exa_client(api_key: str):
+    """Shared Exa client, rebuilt only if EXA_API_KEY changes."""
+    global _exa_client, _exa_client_key
+    with _exa_client_lock:
+        if _exa_client is None or _exa_client_key != api_key:
+            from exa_py import Exa
+            _exa_client = Exa(api_key=api_key)
+            _exa_client_key = api_key
+        return _exa_client
+
+
+def _canonical_key(paper: Dict[str, Any]) -> str:
+    """
+    Dedup key for a discovered paper: normalized DOI, else arXiv ID, else
+    the start of the title. DOIs are case-insensitive and often arrive as
+    resolver URLs, which previously let cross-source duplicates through.
+    """
+    doi = (paper.get('doi') or '').strip().lower()
+    for prefix in _DOI_PREFIXES:
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+            break
+    return doi or paper.get('arxiv_id') or (paper.get('title') or '')[:50].lower()
+
+
+def _keyed(paper: Dict[str, Any]):
+    return _canonical_key(paper), paper
+
+
+def _trunc(text: Optional[str], n: int = ABSTRACT_CHARS) -> Optional[str]:
+    """First n characters of text, or None when it is empty."""
+    return text[:n] if text else None
+
+
+def _s2_paper_dict(paper, source: str) -> Dict[str, Any]:
+    """Map a semanticscholar Paper onto the discover_papers result shape."""
+    external_ids = paper.externalIds or {}
+    return {
+        'title': paper.title,
+        'authors': [a.name for a in (paper.authors or [])[:3]],
+        'year': paper.year,
+        'abstract': _trunc(paper.abstract),
+        'arxiv_id': external_ids.get('ArXiv'),
+        'doi': external_ids.get('DOI'),
+        'citations': paper.citationCount or 0,
+        'source': source
+    }
+
+
+def _source_available(name: str) -> bool:
+    return time.monotonic() >= _source_down_until.get(name, 0.0)
+
+
+def _mark_source_down(name: str) -> None:
+    _source_down_until[name] = time.monotonic() + SOURCE_COOLDOWN
+
+
+def _auto_add(papers: List[Dict[str, Any]]) -> int:
+    """
+    Add every paper with a DOI (preferred) or arXiv ID to the library in one
+    batch. Returns how many are now in the library (added or already there).
+    """
+    from .library import add_papers_bulk
+    
+    to_add = []
+    for p in papers:
+        doi = p.get('doi')
+        if doi:
+            to_add.append((doi, "doi"))
+        else:
+            arxiv_id = p.get('arxiv_id')
+            if arxiv_id:
+                to_add.append((arxiv_id, "arxiv"))
+    return sum(
+        result.get("status") in ("success", "already_exists")
+        for result in add_papers_bulk(to_add)
+    )
+
+
+def _tracking_row(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """Literature-sheet row (track_reviewed_paper kwargs) for a discovered paper."""
+    authors = paper.get("authors")
+    return {
+        "citation_key": "",  # not in library yet
+        "title": paper.get("title", "") or "",
+        "authors": ", ".join(str(a) for a in authors if a) if isinstance(authors, list) else str(authors or ""),
+        "year": str(paper.get("year") or ""),
+        "relevance": 3,
+        "utility": 2,
+        "source": f"discover_papers:{paper.get('source','')}",
+        "doi": paper.get("doi"),
+        "arxiv_id": paper.get("arxiv_id"),
+        "citations": paper.get("citations"),
+    }
+
+
+def _arxiv_id_from_url(url: str):
+    """
+    arXiv ID from an arxiv.org URL. The usual .../abs/NNNN.NNNNN[vN] shape is
+    read straight off the last path segment; anything else goes to the regex.
+    """
+    tail = url.rstrip('/').rpartition('/')[2].partition('v')[0]
+    if (len(tail) in (9, 10) and tail[4] == '.' and tail.isascii()
+            and tail[:4].isdigit() and tail[5:].isdigit()):
+        return tail
+    match = _ARXIV_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _search_sources(query: str, limit: int) -> List[Dict[str, Any]]:
+    """Keyword search across Semantic Scholar and paper-scraper, deduplicated."""
+    import itertools
+    
+    def _search_s2():
+        """Inner function to run S2 search (can be timed out)."""
+        sch = _get_s2_client()
+        s2_papers = []
+        results = sch.search_paper(query, limit=limit, fields=S2_SEARCH_FIELDS)
+        # .items is the page already fetched; iterating the results object
+        # itself auto-paginates once that page is exhausted
+        for paper in results.items[:limit]:
+            s2_papers.append(_keyed(_s2_paper_dict(paper, 'S2')))
+        return s2_papers
+    
+    def _search_ps():
+        """Inner function to run paper-scraper search (can be timed out)."""
+        if scraper_client is None:
+            raise ImportError("utils.scraper_client unavailable")
+        return [
+            _keyed({
+                'title': paper.get('title', 'Unknown'),
+                'authors': paper.get('authors', [])[:3],
+                'year': paper.get('year'),
+                'abstract': _trunc(paper.get('abstract')),
+                'arxiv_id': paper.get('arxiv_id'),
+                'doi': paper.get('doi'),
+                'citations': 0,
+                'source': 'PS'
+            })
+            for paper in scraper_client.search_papers(query, 10)
+        ]
+    
+    # Both sources are independent network I/O - run them concurrently so
+    # the wall time is the slower of the two, not their sum
+    console.print("[dim]  → Semantic Scholar + paper-scraper...[/dim]")
+    started = time.monotonic()
+    s2_future = _DISCOVERY_EXECUTOR.submit(_search_s2) if _source_available("S2") else None
+    ps_future = _DISCOVERY_EXECUTOR.submit(_search_ps) if _source_available("paper-scraper") else None
+    
+    # 1. Semantic Scholar results first (with timeout to prevent blocking)
+    s2_results = []
+    if s2_future is None:
+        console.print("[dim]S2 skipped (timed out recently)[/dim]")
+    else:
+        try:
+            s2_results = s2_future.result(timeout=S2_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            console.print("[dim]S2 timed out, continuing with other sources[/dim]")
+            _mark_source_down("S2")
+        except Exception as e:
+            # Errors (e.g. rate limits) are usually transient - no cooldown
+            error_msg = str(e) if str(e) else type(e).__name__
+            console.print(f"[yellow]S2 error: {error_msg}[/yellow]")
+    
+    # 2. paper-scraper, within whatever is left of its own budget (it has
+    # been running while we waited on S2)
+    ps_results = []
+    if ps_future is None:
+        console.print("[dim]paper-scraper skipped (failed recently)[/dim]")
+    else:
+        try:
+            remaining = max(0.0, PS_TIMEOUT - (time.monotonic() - started))
+            ps_results = ps_future.result(timeout=remaining)
+        except concurrent.futures.TimeoutError:
+            console.print("[dim]paper-scraper timed out, continuing with S2 results[/dim]")
+            _mark_source_down("paper-scraper")
+        except Exception as e:
+            console.print(f"[dim]paper-scraper: {e}[/dim]")
+            _mark_source_down("paper-scraper")
+    
+    # Merge, S2 first: the first paper seen for each canonical key wins.
+    # Callers only ever use the first `limit`, so stop once we have them.
+    merged: Dict[str, Dict[str, Any]] = {}
+    for key, paper in itertools.chain(s2_results, ps_results):
+        merged.setdefault(key, paper)
+        if len(merged) >= limit:
+            break
+    papers = list(merged.values())
+    return papers
+
 
 def discover_papers(query: str = None, limit: int = 15, cited_by: str = None, references: str = None) -> List[Dict[str, Any]]:
     """
@@ -67,101 +338,52 @@ def discover_papers(query: str = None, limit: int = 15, cited_by: str = None, re
         # Backward citations (what does this paper cite?)
         discover_papers(references="DOI:10.48550/arXiv.1706.03762")
     """
-    from semanticscholar import SemanticScholar
-    import itertools
-    import concurrent.futures
     
     # Citation network search
     if cited_by or references:
         console.print(f"[dim]🔗 Citation network search...[/dim]")
         
-        s2_api_key = os.getenv('SEMANTIC_SCHOLAR_API_KEY')
-        sch = SemanticScholar(api_key=s2_api_key) if s2_api_key else SemanticScholar()
+        sch = _get_s2_client()
         
         try:
             papers = []
             
+            # The citations/references endpoints return the linked papers
+            # hydrated with just our fields, capped at `limit`, in one
+            # request - instead of get_paper() pulling the full record with
+            # every citation and reference attached. Only the first page
+            # (.items) is read, so the client never auto-paginates.
+            page_size = max(1, min(limit, S2_MAX_PAGE))
             if cited_by:
                 console.print(f"[dim]  → Finding papers citing: {cited_by}[/dim]")
                 # Get papers that cite this work
-                paper = sch.get_paper(cited_by)
-                if paper and paper.citations:
-                    for citation in itertools.islice(paper.citations, limit):
-                        arxiv_id = None
-                        doi = None
-                        if citation.externalIds:
-                            arxiv_id = citation.externalIds.get('ArXiv')
-                            doi = citation.externalIds.get('DOI')
-                        papers.append({
-                            'title': citation.title,
-                            'authors': [a.name for a in (citation.authors or [])][:3],
-                            'year': citation.year,
-                            'abstract': citation.abstract[:400] if citation.abstract else None,
-                            'arxiv_id': arxiv_id,
-                            'doi': doi,
-                            'citations': citation.citationCount or 0,
-                            'source': 'S2-Citations'
-                        })
+                results = sch.get_paper_citations(cited_by, fields=S2_SEARCH_FIELDS, limit=page_size)
+                papers = [
+                    _s2_paper_dict(citation.paper, 'S2-Citations')
+                    for citation in results.items[:limit]
+                    if citation.paper
+                ]
             
             elif references:
                 console.print(f"[dim]  → Finding papers referenced by: {references}[/dim]")
                 # Get papers referenced by this work
-                paper = sch.get_paper(references)
-                if paper and paper.references:
-                    for reference in itertools.islice(paper.references, limit):
-                        arxiv_id = None
-                        doi = None
-                        if reference.externalIds:
-                            arxiv_id = reference.externalIds.get('ArXiv')
-                            doi = reference.externalIds.get('DOI')
-                        papers.append({
-                            'title': reference.title,
-                            'authors': [a.name for a in (reference.authors or [])][:3],
-                            'year': reference.year,
-                            'abstract': reference.abstract[:400] if reference.abstract else None,
-                            'arxiv_id': arxiv_id,
-                            'doi': doi,
-                            'citations': reference.citationCount or 0,
-                            'source': 'S2-References'
-                        })
+                results = sch.get_paper_references(references, fields=S2_SEARCH_FIELDS, limit=page_size)
+                papers = [
+                    _s2_paper_dict(reference.paper, 'S2-References')
+                    for reference in results.items[:limit]
+                    if reference.paper
+                ]
             
             console.print(f"[green]✓ Found {len(papers)} papers via citation network[/green]")
             
             # AUTO-ADD: Automatically add all papers with DOI or arXiv ID to library
-            added_count = 0
-            from .library import add_paper
-            
-            for p in papers[:limit]:
-                identifier = p.get('doi') or p.get('arxiv_id')
-                if identifier:
-                    try:
-                        source = "doi" if p.get('doi') else "arxiv"
-                        result = add_paper(identifier, source)
-                        if result.get("status") in ("success", "already_exists"):
-                            added_count += 1
-                    except Exception as e:
-                        console.print(f"[dim]Could not add {identifier}: {e}[/dim]")
+            added_count = _auto_add(papers[:limit])
             
             if added_count > 0:
                 console.print(f"[green]✓ Added/verified {added_count} papers in library[/green]")
             
             # Track discovery results in literature sheet
-            for p in papers[:limit]:
-                try:
-                    track_reviewed_paper(
-                        citation_key="",
-                        title=p.get("title", "") or "",
-                        authors=", ".join(p.get("authors") or []) if isinstance(p.get("authors"), list) else str(p.get("authors") or ""),
-                        year=str(p.get("year") or ""),
-                        relevance=3,
-                        utility=2,
-                        source=f"discover_papers:{p.get('source','')}",
-                        doi=p.get("doi"),
-                        arxiv_id=p.get("arxiv_id"),
-                        citations=p.get("citations"),
-                    )
-                except Exception:
-                    pass
+            track_reviewed_papers_bulk([_tracking_row(p) for p in papers[:limit]])
             return papers[:limit]
             
         except Exception as e:
@@ -174,132 +396,31 @@ def discover_papers(query: str = None, limit: int = 15, cited_by: str = None, re
     
     console.print(f"[dim]🔍 Unified search: {query}[/dim]")
     
-    papers = []
-    seen_ids = set()
-    
-    # 1. Search Semantic Scholar (with timeout to prevent blocking)
-    console.print("[dim]  → Semantic Scholar...[/dim]")
-    
-    # Use API key if available for higher rate limits
-    s2_api_key = os.getenv('SEMANTIC_SCHOLAR_API_KEY')
-    
-    def _search_s2():
-        """Inner function to run S2 search (can be timed out)."""
-        sch = SemanticScholar(api_key=s2_api_key) if s2_api_key else SemanticScholar()
-        s2_papers = []
-        results = sch.search_paper(query, limit=limit)
-        for paper in itertools.islice(results, limit):
-            arxiv_id = None
-            doi = None
-            if paper.externalIds:
-                arxiv_id = paper.externalIds.get('ArXiv')
-                doi = paper.externalIds.get('DOI')
-            s2_papers.append({
-                'title': paper.title,
-                'authors': [a.name for a in paper.authors][:3],
-                'year': paper.year,
-                'abstract': paper.abstract[:400] if paper.abstract else None,
-                'arxiv_id': arxiv_id,
-                'doi': doi,
-                'citations': paper.citationCount or 0,
-                'source': 'S2'
-            })
-        return s2_papers
-    
-    try:
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-        future = executor.submit(_search_s2)
-        try:
-            s2_results = future.result(timeout=30)  # 30 second timeout for S2
-            for paper in s2_results:
-                key = paper['doi'] or paper['arxiv_id'] or paper['title'][:50]
-                if key not in seen_ids:
-                    seen_ids.add(key)
-                    papers.append(paper)
-            executor.shutdown(wait=False)
-        except concurrent.futures.TimeoutError:
-            console.print("[dim]S2 timed out, continuing with other sources[/dim]")
-            executor.shutdown(wait=False)  # Don't wait for hung thread
-    except Exception as e:
-        error_msg = str(e) if str(e) else type(e).__name__
-        console.print(f"[yellow]S2 error: {error_msg}[/yellow]")
-    
-    # 2. Search paper-scraper (with timeout to prevent blocking)
-    console.print("[dim]  → paper-scraper...[/dim]")
-    try:
-        sys.path.insert(0, str(SCRIPTS_PATH))
-        from utils import scraper_client
-        
-        # Run with timeout to prevent blocking on network issues
-        ps_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-        future = ps_executor.submit(scraper_client.search_papers, query, 10)
-        try:
-            ps_results = future.result(timeout=5)  # 5 second timeout (fast fail)
-            ps_executor.shutdown(wait=False)
-        except concurrent.futures.TimeoutError:
-            console.print("[dim]paper-scraper timed out, continuing with S2 results[/dim]")
-            ps_executor.shutdown(wait=False)  # Don't wait for hung thread
-            ps_results = []
-        
-        for paper in ps_results:
-            arxiv_id = paper.get('arxiv_id')
-            doi = paper.get('doi')
-            
-            key = doi or arxiv_id or paper.get('title', '')[:50]
-            if key in seen_ids:
-                continue
-            seen_ids.add(key)
-            
-            papers.append({
-                'title': paper.get('title', 'Unknown'),
-                'authors': paper.get('authors', [])[:3],
-                'year': paper.get('year'),
-                'abstract': paper.get('abstract', '')[:400] if paper.get('abstract') else None,
-                'arxiv_id': arxiv_id,
-                'doi': doi,
-                'citations': 0,
-                'source': 'PS'
-            })
-    except Exception as e:
-        console.print(f"[dim]paper-scraper: {e}[/dim]")
+    # Repeat searches within the TTL reuse the merged network results;
+    # auto-add and literature tracking below still run every call
+    cache_key = (query.strip().lower(), limit)
+    cached = _search_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL:
+        console.print("[dim]  → Using cached search results[/dim]")
+        papers = [dict(p) for p in cached[1]]
+    else:
+        papers = _search_sources(query, limit)
+        if papers:
+            _search_cache.pop(cache_key, None)
+            _search_cache[cache_key] = (time.monotonic(), [dict(p) for p in papers])
+            while len(_search_cache) > DISCOVERY_CACHE_SIZE:
+                del _search_cache[next(iter(_search_cache))]
     
     console.print(f"[green]✓ Found {len(papers)} unique papers[/green]")
     
     # AUTO-ADD: Automatically add all papers with DOI or arXiv ID to library
-    added_count = 0
-    from .library import add_paper
-    
-    for p in papers[:limit]:
-        identifier = p.get('doi') or p.get('arxiv_id')
-        if identifier:
-            try:
-                source = "doi" if p.get('doi') else "arxiv"
-                result = add_paper(identifier, source)
-                if result.get("status") in ("success", "already_exists"):
-                    added_count += 1
-            except Exception as e:
-                console.print(f"[dim]Could not add {identifier}: {e}[/dim]")
+    added_count = _auto_add(papers[:limit])
     
     if added_count > 0:
         console.print(f"[green]✓ Added/verified {added_count} papers in library[/green]")
     
     # Track discovery results in literature sheet
-    for p in papers[:limit]:
-        try:
-            track_reviewed_paper(
-                citation_key="",  # not in library yet
-                title=p.get("title", "") or "",
-                authors=", ".join(p.get("authors") or []) if isinstance(p.get("authors"), list) else str(p.get("authors") or ""),
-                year=str(p.get("year") or ""),
-                relevance=3,
-                utility=2,
-                source=f"discover_papers:{p.get('source','')}",
-                doi=p.get("doi"),
-                arxiv_id=p.get("arxiv_id"),
-                citations=p.get("citations"),
-            )
-        except Exception:
-            pass
+    track_reviewed_papers_bulk([_tracking_row(p) for p in papers[:limit]])
     return papers[:limit]
 
 
@@ -323,19 +444,26 @@ def exa_search(query: str, limit: int = 5) -> List[Dict[str, Any]]:
     """
     console.print(f"[dim]🧠 Exa.ai search (costs credits): {query}[/dim]")
     
+    if not _source_available("Exa"):
+        console.print("[dim]Exa skipped (failed recently)[/dim]")
+        return []
+    
     try:
-        from exa_py import Exa
         exa_key = os.getenv('EXA_API_KEY')
         if not exa_key:
             return [{"error": "EXA_API_KEY not configured"}]
         
-        exa = Exa(api_key=exa_key)
-        results = exa.search_and_contents(
-            query,
-            type="neural",
-            num_results=limit,
-            text={"max_characters": 500}
-        )
+        exa = _get_exa_client(exa_key)
+        try:
+            results = exa.search_and_contents(
+                query,
+                type="neural",
+                num_results=limit,
+                text={"max_characters": ABSTRACT_CHARS}  # only this much is kept
+            )
+        except _EXA_NETWORK_ERRORS:
+            _mark_source_down("Exa")
+            raise
         
         papers = []
         for r in results.results:
@@ -344,20 +472,18 @@ def exa_search(query: str, limit: int = 5) -> List[Dict[str, Any]]:
             
             # Extract arXiv ID from URL
             if 'arxiv.org' in r.url:
-                match = re.search(r'(\d{4}\.\d{4,5})', r.url)
-                if match:
-                    arxiv_id = match.group(1)
+                arxiv_id = _arxiv_id_from_url(r.url)
             
             # Extract DOI from URL
             if 'doi.org' in r.url:
-                match = re.search(r'(10\.\d{4,}/[^\s]+)', r.url)
+                match = _DOI_RE.search(r.url)
                 if match:
                     doi = match.group(1).rstrip('/')
             
             papers.append({
                 'title': r.title,
                 'url': r.url,
-                'abstract': r.text[:400] if r.text else None,
+                'abstract': _trunc(r.text),
                 'arxiv_id': arxiv_id,
                 'doi': doi,
                 'source': 'Exa'
@@ -366,39 +492,26 @@ def exa_search(query: str, limit: int = 5) -> List[Dict[str, Any]]:
         console.print(f"[green]✓ Exa found {len(papers)} results[/green]")
         
         # AUTO-ADD: Add papers with DOI or arXiv ID to library (like discover_papers)
-        added_count = 0
-        from .library import add_paper
-        
-        for p in papers:
-            identifier = p.get('doi') or p.get('arxiv_id')
-            if identifier:
-                try:
-                    source = "doi" if p.get('doi') else "arxiv"
-                    result = add_paper(identifier, source)
-                    if result.get("status") in ("success", "already_exists"):
-                        added_count += 1
-                except Exception as e:
-                    console.print(f"[dim]Could not add {identifier}: {e}[/dim]")
+        added_count = _auto_add(papers)
         
         if added_count > 0:
             console.print(f"[green]✓ Added/verified {added_count} papers in library[/green]")
         
         # Track in literature sheet
-        for p in papers:
-            try:
-                track_reviewed_paper(
-                    citation_key="",
-                    title=p.get("title", "") or "",
-                    authors="",
-                    year="",
-                    relevance=3,
-                    utility=3,
-                    source="exa_search",
-                    doi=p.get("doi"),
-                    arxiv_id=p.get("arxiv_id"),
-                )
-            except Exception:
-                pass
+        track_reviewed_papers_bulk([
+            {
+                "citation_key": "",
+                "title": p.get("title", "") or "",
+                "authors": "",
+                "year": "",
+                "relevance": 3,
+                "utility": 3,
+                "source": "exa_search",
+                "doi": p.get("doi"),
+                "arxiv_id": p.get("arxiv_id"),
+            }
+            for p in papers
+        ])
         
         return papers
     except Exception as e:
@@ -7,13 +7,16 @@ Provides tools for managing the paper library:
 - Querying papers with RAG (PaperQA2)
 """
 import asyncio
+import atexit
 import hashlib
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import yaml
 from rich.console import Console
 
 # Paths
@@ -22,11 +25,28 @@ LIBRARY_PATH = REPO_ROOT / "library"
 PAPIS_CONFIG = REPO_ROOT / "papis.config"
 SCRIPTS_PATH = REPO_ROOT / "scripts"
 
+# utils/ and qa.py live under scripts/; make them importable once
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
 # RAG model is configured via env vars (see README):
 # - RESEARCH_RAG_MODEL
 
 console = Console()
 
+# libyaml's C parser when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# (citation library version, identifier -> citation key); see _known_identifiers
+_known_ids: Tuple[int, Dict[str, str]] = (-1, {})
+
+# One long-lived event loop for query_library. LiteLLM's pooled async HTTP
+# client is bound to the loop that opened it (see qa.configure_litellm_http_pool),
+# so reusing the loop keeps connections warm across queries.
+_qa_loop: Optional[asyncio.AbstractEventLoop] = None
+_qa_loop_thread: Optional[threading.Thread] = None
+_qa_loop_lock = threading.Lock()
+
 # Graceful external tool import for private PDF sources
 try:
     from .external import fetch_pdf_private, PRIVATE_SOURCES_AVAILABLE
@@ -35,7 +55,7 @@ except ImportError:
     PRIVATE_SOURCES_AVAILABLE = False
 
 # Import tracking function for literature sheet
-from .citation import track_reviewed_paper, mark_used_as_evidence
+from .citation import track_reviewed_paper, mark_used_as_evidence, _current_library, _iter_library
 
 
 def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
@@ -55,6 +75,11 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
     Returns:
         Dict with 'status' ("success" or "error") and 'citation_key' if successful
     """
+    return _add_paper(identifier, source)
+
+
+def _add_paper(identifier: str, source: str = "auto", sync_bib: bool = True) -> Dict[str, Any]:
+    """add_paper body; sync_bib=False leaves the master.bib sync to the caller."""
     import shutil
     
     # Auto-detect source
@@ -64,39 +89,27 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
         else:
             source = "arxiv"
     
-    # Check for duplicates before adding (saves time and API credits)
-    import yaml
-    
+    # Check for duplicates before adding (saves time and API credits).
+    # Uses the cached library entries, so only changed info.yaml are parsed.
     normalized_id = identifier.lower().strip()
+    # arXiv ID can be in formats: 1234.5678, arxiv:1234.5678, etc.
+    arxiv_id = normalized_id.replace('arxiv:', '').split('/')[-1]
     
-    for info_file in LIBRARY_PATH.rglob("info.yaml"):
-        try:
-            with open(info_file) as f:
-                data = yaml.safe_load(f)
-            
-            # Check DOI match
-            if source == "doi" and data.get('doi'):
-                if normalized_id in data.get('doi', '').lower():
-                    console.print(f"[yellow]⚠️  Paper already in library: @{data.get('ref')}[/yellow]")
-                    return {
-                        "status": "already_exists",
-                        "citation_key": data.get('ref'),
-                        "message": f"Paper already indexed as @{data.get('ref')}"
-                    }
-            
-            # Check arXiv match
-            if source == "arxiv" and data.get('eprint'):
-                # arXiv ID can be in formats: 1234.5678, arxiv:1234.5678, etc.
-                arxiv_id = normalized_id.replace('arxiv:', '').split('/')[-1]
-                if arxiv_id == data.get('eprint', '').lower():
-                    console.print(f"[yellow]⚠️  Paper already in library: @{data.get('ref')}[/yellow]")
-                    return {
-                        "status": "already_exists",
-                        "citation_key": data.get('ref'),
-                        "message": f"Paper already indexed as @{data.get('ref')}"
-                    }
-        except:
-            pass  # Ignore corrupted info files
+    for entry in _current_library()[1]:
+        if source == "doi":
+            matched = bool(entry.get('doi')) and normalized_id in entry['doi']
+        elif source == "arxiv":
+            matched = bool(entry.get('eprint')) and arxiv_id == entry['eprint']
+        else:
+            matched = False
+        if matched:
+            ref = entry['ref'] or None
+            console.print(f"[yellow]⚠️  Paper already in library: @{ref}[/yellow]")
+            return {
+                "status": "already_exists",
+                "citation_key": ref,
+                "message": f"Paper already indexed as @{ref}"
+            }
     
     console.print(f"[dim]📥 Adding: {source}:{identifier}[/dim]")
     
@@ -108,6 +121,7 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
     
     pdf_path = None
     papis_success = False
+    latest_dir = None
     
     # For DOIs: Try private sources FIRST (most reliable)
     if source == "doi" and PRIVATE_SOURCES_AVAILABLE and fetch_pdf_private:
@@ -136,10 +150,10 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
         if result.returncode == 0:
             papis_success = True
             
-            # Check if PDF was actually added
-            recent_dirs = sorted(LIBRARY_PATH.glob("*"), key=lambda x: x.stat().st_mtime, reverse=True)
-            if recent_dirs:
-                latest_dir = recent_dirs[0]
+            # Check if PDF was actually added. Resolve the new folder now,
+            # before the bib sync below touches library/.last_touch.
+            latest_dir = _newest_library_dir()
+            if latest_dir:
                 pdfs = list(latest_dir.glob("*.pdf"))
                 if not pdfs and pdf_path and pdf_path.exists():
                     # Papis didn't pick up our PDF, copy it manually
@@ -157,7 +171,7 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
                             console.print(f"[green]✓ PDF fetched via private sources fallback[/green]")
                             try:
                                 fallback_pdf.unlink()
-                            except:
+                            except OSError:
                                 pass
                     except Exception as e:
                         console.print(f"[dim]Private sources fallback failed: {e}[/dim]")
@@ -172,27 +186,20 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
         if pdf_path and pdf_path.exists():
             try:
                 pdf_path.unlink()
-            except:
+            except OSError:
                 pass
     
     if papis_success:
-        # Sync master.bib using existing utility
-        try:
-            sys.path.insert(0, str(SCRIPTS_PATH))
-            from utils.sync_bib import sync_master_bib
-            sync_master_bib()
-        except Exception as e:
-            console.print(f"[yellow]Warning: bib sync issue: {e}[/yellow]")
+        if sync_bib:
+            _sync_master_bib()
         
         # Track the added paper for literature sheet
         try:
-            import yaml
-            recent_dirs = sorted(LIBRARY_PATH.glob("*"), key=lambda x: x.stat().st_mtime, reverse=True)
-            if recent_dirs:
-                info_file = recent_dirs[0] / "info.yaml"
+            if latest_dir:
+                info_file = latest_dir / "info.yaml"
                 if info_file.exists():
-                    with open(info_file) as f:
-                        data = yaml.safe_load(f)
+                    with open(info_file, "rb") as f:
+                        data = yaml.load(f, Loader=_YAML_LOADER)
                     track_reviewed_paper(
                         citation_key=data.get('ref', identifier),
                         title=data.get('title', 'Unknown'),
@@ -206,17 +213,17 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
             pass  # Don't fail add_paper if tracking fails
         
         # AUTO-INDEX: Trigger immediate indexing so paper is available for queries
+        qa_index_current = False  # QA pickle covers this paper (or it has no PDF)
         try:
             console.print(f"[dim]📑 Auto-indexing new paper...[/dim]")
             from qa import load_existing_docs, save_docs, load_manifest, save_manifest, compute_md5
             from qa import setup_paperqa_settings
             from paperqa import Docs
-            import asyncio
             
             # Find the newly added PDF
-            recent_dirs = sorted(LIBRARY_PATH.glob("*"), key=lambda x: x.stat().st_mtime, reverse=True)
-            if recent_dirs:
-                new_pdfs = list(recent_dirs[0].glob("*.pdf"))
+            if latest_dir:
+                new_pdfs = list(latest_dir.glob("*.pdf"))
+                qa_index_current = not new_pdfs
                 if new_pdfs:
                     pdf_path = new_pdfs[0]
                     file_hash = compute_md5(pdf_path)
@@ -227,26 +234,134 @@ def add_paper(identifier: str, source: str = "auto") -> Dict[str, Any]:
                         console.print(f"[dim]Creating new index (no existing pickle)[/dim]")
                         docs = Docs()
                     
-                    # Add the new paper
-                    settings = setup_paperqa_settings()
-                    asyncio.run(docs.aadd(pdf_path, dockey=file_hash, settings=settings))
+                    # Add the new paper on the shared QA loop, with settings
+                    # (and LiteLLM's loop-scoped HTTP client) set up there
+                    async def _index_new_paper():
+                        settings = setup_paperqa_settings()
+                        await docs.aadd(pdf_path, dockey=file_hash, settings=settings)
+                    
+                    _run_on_qa_loop(_index_new_paper())
                     save_docs(LIBRARY_PATH, docs)
                     
                     # ALWAYS update manifest (even if indexing fails later)
                     manifest = load_manifest(LIBRARY_PATH)
                     manifest[pdf_path.name] = file_hash
                     save_manifest(LIBRARY_PATH, manifest)
+                    qa_index_current = True
                     
                     console.print(f"[green]✓ Paper indexed and ready for queries[/green]")
         except Exception as e:
             console.print(f"[dim]Auto-index skipped: {e}[/dim]")
         
         console.print(f"[green]✓ Added {identifier}[/green]")
-        return {"status": "success", "identifier": identifier}
+        return {"status": "success", "identifier": identifier, "qa_index_current": qa_index_current}
     else:
         return {"status": "error", "message": "Failed to add paper from any source"}
 
 
+def _newest_library_dir() -> Optional[Path]:
+    """
+    Most recently modified paper folder in the library, in one scandir pass.
+    
+    Dot-entries are skipped: the bib sync touches library/.last_touch and the
+    QA index sidecars live there too, and none of them is a paper.
+    """
+    try:
+        with os.scandir(LIBRARY_PATH) as it:
+            newest = max(
+                (e for e in it if not e.name.startswith(".") and e.is_dir()),
+                key=lambda e: e.stat().st_mtime_ns,
+                default=None,
+            )
+    except OSError:
+        return None
+    return Path(newest.path) if newest else None
+
+
+def _sync_master_bib() -> None:
+    """Regenerate master.bib using the existing utility."""
+    try:
+        from utils.sync_bib import sync_master_bib
+        sync_master_bib()
+    except Exception as e:
+        console.print(f"[yellow]Warning: bib sync issue: {e}[/yellow]")
+
+
+def _known_identifiers() -> Dict[str, str]:
+    """
+    Lowercased DOI / arXiv eprint -> citation key for every library paper.
+    
+    Built from citation's cached library entries and rebuilt only when that
+    cache's version moves (a paper was added, changed or removed).
+    """
+    global _known_ids
+    version, entries = _current_library()
+    if _known_ids[0] != version:
+        known = {}
+        for entry in entries:
+            for value in (entry.get("doi"), entry.get("eprint")):
+                if value:
+                    known[value] = entry["citation_key"]
+        _known_ids = (version, known)
+    return _known_ids[1]
+
+
+def add_papers_bulk(items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Add several papers in one pass (e.g. the auto-add step of discovery).
+    
+    Identifiers already in the library are answered from a cached
+    identifier map without running papis; master.bib is synced once at the
+    end instead of after every paper.
+    
+    Args:
+        items: (identifier, source) pairs, source as for add_paper
+    
+    Returns:
+        One add_paper-style result dict per item, in order
+    """
+    if not items:
+        return []
+    
+    known = _known_identifiers()
+    results = []
+    added_any = False
+    for identifier, source in items:
+        try:
+            if source == "auto":
+                source = "doi" if identifier.startswith("10.") else "arxiv"
+            normalized_id = identifier.lower().strip()
+            if source == "arxiv":
+                normalized_id = normalized_id.replace('arxiv:', '').split('/')[-1]
+            if normalized_id in known:
+                citation_key = known[normalized_id]
+                result = {
+                    "status": "already_exists",
+                    "citation_key": citation_key,
+                    "message": f"Paper already indexed as @{citation_key}"
+                }
+            else:
+                result = _add_paper(identifier, source, sync_bib=False)
+        except Exception as e:
+            console.print(f"[dim]Could not add {identifier}: {e}[/dim]")
+            result = {"status": "error", "message": str(e)}
+        added_any = added_any or result.get("status") == "success"
+        results.append(result)
+    
+    if added_any:
+        _sync_master_bib()
+        # The sync touches library/.last_touch after the papers were indexed;
+        # when the QA pickle covers all of them, re-stamp it so `research qa`
+        # keeps its unchanged-library fast path
+        if all(r.get("qa_index_current") for r in results if r.get("status") == "success"):
+            try:
+                from qa import mark_index_current
+                mark_index_current(LIBRARY_PATH)
+            except ImportError:
+                pass
+    return results
+
+
 
 def list_library() -> List[Dict[str, str]]:
     """
@@ -258,29 +373,62 @@ def list_library() -> List[Dict[str, str]]:
     Returns:
         List of papers with: citation_key, title, authors, year
     """
-    import yaml
-    
     console.print(f"[dim]📖 Listing library...[/dim]")
     
+    # Shares citation's mtime-keyed cache (and its on-disk index), so only info.yaml files changed since the last call are parsed
     papers = []
-    for info_file in LIBRARY_PATH.rglob("info.yaml"):
+    for entry in _iter_library():
         try:
-            with open(info_file) as f:
-                data = yaml.safe_load(f)
-            
             papers.append({
-                "citation_key": data.get('ref', 'unknown'),
-                "title": data.get('title', 'Unknown')[:70],
-                "authors": data.get('author', 'Unknown')[:40],
-                "year": str(data.get('year', ''))
+                "citation_key": entry["citation_key"],
+                "title": entry["title"][:70],
+                "authors": entry["authors"][:40],
+                "year": entry["year"]
             })
-        except:
+        except TypeError:
             pass
     
     console.print(f"[green]✓ Library has {len(papers)} papers[/green]")
     return papers
 
 
+def _stop_qa_loop() -> None:
+    if _qa_loop is not None and not _qa_loop.is_closed():
+        _qa_loop.call_soon_threadsafe(_qa_loop.stop)
+
+
+def _run_on_qa_loop(coro):
+    """Run a coroutine to completion on the shared background QA loop."""
+    global _qa_loop, _qa_loop_thread
+    with _qa_loop_lock:
+        if _qa_loop_thread is None or not _qa_loop_thread.is_alive():
+            if _qa_loop_thread is None:
+                atexit.register(_stop_qa_loop)
+            _qa_loop = asyncio.new_event_loop()
+            _qa_loop_thread = threading.Thread(target=_qa_loop.run_forever, name="qa-loop", daemon=True)
+            _qa_loop_thread.start()
+        loop = _qa_loop
+    
+    async def _guarded():
+        # qa exits via sys.exit() on query errors; a SystemExit escaping into
+        # the loop would kill its thread, so hand it back to the caller
+        try:
+            return await coro, None
+        except SystemExit as e:
+            return None, e
+    
+    future = asyncio.run_coroutine_threadsafe(_guarded(), loop)
+    try:
+        result, exit_exc = future.result()
+    except BaseException:
+        # e.g. Ctrl-C while waiting - don't leave the query running
+        future.cancel()
+        raise
+    if exit_exc is not None:
+        raise exit_exc
+    return result
+
+
 def query_library(question: str, paper_filter: Optional[str] = None) -> Dict[str, Any]:
     """
     Ask a research question about papers in the library using RAG (PaperQA2).
@@ -315,8 +463,8 @@ def query_library(question: str, paper_filter: Optional[str] = None) -> Dict[str
         
         console.print(f"[dim]🤔 Querying (via Qdrant): {question[:60]}...[/dim]")
         
-        # Run the async QA function synchronously
-        response = asyncio.run(_async_answer_question(question, library_path, paper_filter))
+        # Run the async QA function synchronously on the shared loop
+        response = _run_on_qa_loop(_async_answer_question(question, library_path, paper_filter))
         
         # Extract sources
         sources = []
@@ -0,0 +1,77 @@
+"""
+Int8-quantized vector store for PaperQA's in-memory text index.
+
+PaperQA's default NumpyVectorStore scores every chunk against the query with a
+float64 cosine similarity over the full embedding matrix. This store keeps an
+int8 copy of the unit-normalised embeddings instead, uses it for a coarse
+linear scan, and re-ranks only the shortlist with exact cosine scores, so the
+returned scores are the same cosine similarities the default store reports.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from paperqa.llms import EmbeddingModes, NumpyVectorStore
+
+# Shortlist size for exact re-ranking, as a multiple of k
+RERANK_FACTOR = 4
+
+
+def quantize_int8(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length and map it onto [-127, 127] int8."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.clip(np.round(matrix / norms * 127), -127, 127).astype(np.int8)
+
+
+def _unit(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class Int8VectorStore(NumpyVectorStore):
+    """NumpyVectorStore with an int8 coarse scan and exact re-rank."""
+
+    # (number of texts, int8 matrix) - rebuilt when texts are added
+    _int8_cache: Optional[Tuple[int, np.ndarray]] = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._int8_cache = None
+
+    def _int8_matrix(self) -> np.ndarray:
+        n = len(self.texts)
+        if self._int8_cache is None or self._int8_cache[0] != n:
+            self._int8_cache = (n, quantize_int8([t.embedding for t in self.texts]))
+        return self._int8_cache[1]
+
+    async def similarity_search(
+        self, query: str, k: int, embedding_model
+    ) -> Tuple[Sequence, List[float]]:
+        k = min(k, len(self.texts))
+        if k == 0:
+            return [], []
+
+        embedding_model.set_mode(EmbeddingModes.QUERY)
+        np_query = np.asarray((await embedding_model.embed_documents([query]))[0], dtype=np.float32)
+        embedding_model.set_mode(EmbeddingModes.DOCUMENT)
+
+        # Coarse pass: int8 dot products accumulated in int32
+        coarse = np.matmul(self._int8_matrix(), quantize_int8(np_query)[0], dtype=np.int32)
+        n_candidates = min(len(self.texts), k * RERANK_FACTOR)
+        if n_candidates < len(self.texts):
+            candidates = np.argpartition(-coarse, n_candidates - 1)[:n_candidates]
+        else:
+            candidates = np.arange(len(self.texts))
+
+        # Exact pass: cosine similarity on the shortlist only
+        shortlist = np.asarray([self.texts[i].embedding for i in candidates], dtype=np.float32)
+        scores = np.nan_to_num(_unit(shortlist) @ _unit(np_query), nan=-np.inf)
+        order = np.argsort(-scores)[:k]
+        return (
+            [self.texts[candidates[i]] for i in order],
+            [float(scores[i]) for i in order],
+        )
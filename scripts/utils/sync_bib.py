@@ -28,6 +28,8 @@ PAPIS_CMD = REPO_ROOT / ".venv" / "bin" / "papis"
 MASTER_BIB = REPO_ROOT / "master.bib"
 PAPIS_CONFIG = REPO_ROOT / "papis.config"
 LIBRARY_DIR = REPO_ROOT / "library"
+# Touched on every sync so `research qa` knows the library changed
+LIBRARY_TOUCH_FILE = LIBRARY_DIR / ".last_touch"
 
 
 def get_document_paths(doc_folder: Path) -> dict:
@@ -197,12 +199,21 @@ def add_file_paths_to_bibtex(bibtex_content: str) -> str:
     return ''.join(entries)
 
 
+def touch_library():
+    """Mark the library as modified (invalidates the QA index fast path)."""
+    try:
+        LIBRARY_TOUCH_FILE.touch()
+    except OSError as e:
+        logging.warning(f"Failed to touch {LIBRARY_TOUCH_FILE}: {e}")
+
+
 def sync_master_bib():
     """
     Safely regenerates master.bib by exporting to a temp file first,
     then adding local file paths.
     """
     logging.info("Starting master.bib sync...")
+    touch_library()
     
     if not PAPIS_CMD.exists():
         logging.error(f"Papis executable not found at {PAPIS_CMD}")